@@ -1,10 +1,26 @@
 import os
+import orjson
 from flask import Flask, request
+from flask.json.provider import JSONProvider
 from dotenv import load_dotenv
 from .log_config import setup_logging
 
 load_dotenv()
 
+class OrjsonProvider(JSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+
+    Routes that still go through jsonify (health, performance metrics,
+    API info) get the fast Rust encoder instead of stdlib json.
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 def create_app() -> Flask:
     """
     Application factory for the Survey Intelligence API.
@@ -13,6 +29,7 @@ def create_app() -> Flask:
         Flask: Configured Flask application instance.
     """
     app = Flask(__name__, static_folder='../static', static_url_path='')
+    app.json = OrjsonProvider(app)
 
     # Configure logging
     setup_logging()
@@ -1,14 +1,564 @@
 import os
+import asyncio
+import orjson
 import requests
-from typing import Dict, Any, Optional
-from pydantic import BaseModel
+import httpx
+from typing import Dict, Any, Iterator, Optional, List
 from requests.exceptions import RequestException, Timeout
 import logging
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
+import msgspec
+import functools
 import hashlib
+import heapq
+import random
+import unicodedata
+import ahocorasick
+import re
 import time
+import queue
+from collections import OrderedDict
+from types import MappingProxyType
+import threading
 import concurrent.futures
+import atexit
+
+from .llm_cache import get_cache_backend
+
+# Shared worker pool for parallel API calls. A single long-lived executor
+# avoids the thread spawn/teardown cost of creating a ThreadPoolExecutor
+# per request under load.
+_PARALLEL_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=int(os.getenv("OPENAI_PARALLEL_WORKERS", "32")),
+    thread_name_prefix="openai-parallel"
+)
+atexit.register(_PARALLEL_EXECUTOR.shutdown, wait=False)
+
+class ThemeResult(msgspec.Struct):
+    """Detected theme on the hot path; slots-based, cheaper than a dict."""
+    theme_name: str
+    importance: int
+
+
+class QEResult(msgspec.Struct):
+    """Question/explanation pair returned by the theme question generators."""
+    question: str
+    explanation: str
+
+
+# Precompiled patterns for pulling JSON fragments out of LLM responses.
+# Compiling once at import time keeps the hot parsing paths free of
+# per-call re.compile overhead.
+_JSON_OBJ_RE = re.compile(r'\{.*\}', re.DOTALL)
+_JSON_ARR_RE = re.compile(r'\[.*\]', re.DOTALL)
+
+# Aliases the model sometimes emits for the canonical question types
+_TYPE_MAPPING = MappingProxyType({
+    'why': 'reason',
+    'clarify': 'clarification',
+    'explain': 'clarification',
+    'elaborate': 'elaboration',
+    'details': 'elaboration',
+    'examples': 'example',
+    'instance': 'example',
+    'case': 'example',
+    'effects': 'impact',
+    'consequences': 'impact',
+    'results': 'impact',
+    'outcomes': 'impact',
+    'compare': 'comparison',
+    'versus': 'comparison',
+    'difference': 'comparison'
+})
+
+# Fallback question texts used when the model omits a required type
+_DEFAULT_QUESTION_TEXTS = MappingProxyType({
+    'reason': "Why do you think this is the case?",
+    'clarification': "Can you clarify what you mean by this?",
+    'elaboration': "Can you provide more details about this?",
+    'example': "Can you give an example of this?",
+    'impact': "How does this affect you or others?",
+    'comparison': "How does this compare to other options?"
+})
+
+# Replacement words that pull an off-type question back inside its type
+_TYPE_REPLACEMENTS = MappingProxyType({
+    'reason': {
+        'example': 'reason',
+        'instance': 'reason',
+        'case': 'reason',
+        'such as': 'because',
+        'like when': 'because',
+        'specifically': 'in particular'
+    },
+    'clarification': {
+        'example': 'clarification',
+        'instance': 'clarification',
+        'case': 'clarification',
+        'effect': 'meaning',
+        'impact': 'meaning',
+        'specifically': 'precisely'
+    },
+    'elaboration': {
+        'example': 'details',
+        'instance': 'details',
+        'case': 'details',
+        'such as': 'in detail',
+        'like when': 'in detail',
+        'compare': 'expand on',
+        'specifically': 'in detail'
+    },
+    'example': {
+        'why': 'what',
+        'reason': 'instance',
+        'effect': 'example',
+        'impact': 'example',
+        'compare': 'example'
+    },
+    'impact': {
+        'example': 'effect',
+        'instance': 'effect',
+        'case': 'effect',
+        'why': 'how',
+        'reason': 'result',
+        'compare': 'effect',
+        'specifically': 'particularly'
+    },
+    'comparison': {
+        'example': 'alternative',
+        'instance': 'alternative',
+        'case': 'alternative',
+        'why': 'how',
+        'reason': 'difference',
+        'effect': 'difference',
+        'specifically': 'particularly'
+    }
+})
+
+# Question-type boundary tables for the four prompt builders. Hoisted
+# to module scope so prompt building allocates no per-call dicts.
+_TYPE_BOUNDARIES_FOLLOWUP = MappingProxyType({
+    'reason': {
+        'focus': 'WHY they think/feel this way about the response',
+        'avoid': 'examples, details, effects, comparisons',
+        'keywords': ['why', 'reason', 'motivation', 'thinking', 'feeling']
+    },
+    'clarification': {
+        'focus': 'CLARIFY unclear terms or concepts in the response',
+        'avoid': 'examples, details, reasons, effects',
+        'keywords': ['clarify', 'mean', 'understand', 'explain']
+    },
+    'elaboration': {
+        'focus': 'MORE DETAILS about their response',
+        'avoid': 'examples, reasons, effects, comparisons',
+        'keywords': ['details', 'more', 'expand', 'elaborate']
+    },
+    'example': {
+        'focus': 'SPECIFIC EXAMPLES or instances of what they mentioned',
+        'avoid': 'reasons, details, effects, comparisons',
+        'keywords': ['example', 'instance', 'case', 'specific']
+    },
+    'impact': {
+        'focus': 'EFFECTS or CONSEQUENCES of what they mentioned',
+        'avoid': 'reasons, examples, details, comparisons',
+        'keywords': ['effect', 'impact', 'consequence', 'result']
+    },
+    'comparison': {
+        'focus': 'COMPARISON with alternatives to what they mentioned',
+        'avoid': 'reasons, examples, details, effects',
+        'keywords': ['compare', 'versus', 'difference', 'alternative']
+    }
+})
+
+_TYPE_BOUNDARIES_RESTRICTIVE = MappingProxyType({
+    'reason': {
+        'focus': 'WHY they think/feel this way',
+        'avoid': 'examples, details, effects, comparisons',
+        'keywords': ['why', 'reason', 'motivation', 'thinking', 'feeling']
+    },
+    'clarification': {
+        'focus': 'CLARIFY unclear terms or concepts',
+        'avoid': 'examples, details, reasons, effects',
+        'keywords': ['clarify', 'mean', 'understand', 'explain']
+    },
+    'elaboration': {
+        'focus': 'MORE DETAILS about their response',
+        'avoid': 'examples, reasons, effects, comparisons',
+        'keywords': ['details', 'more', 'expand', 'elaborate']
+    },
+    'example': {
+        'focus': 'SPECIFIC EXAMPLES or instances',
+        'avoid': 'reasons, details, effects, comparisons',
+        'keywords': ['example', 'instance', 'case', 'specific']
+    },
+    'impact': {
+        'focus': 'EFFECTS or CONSEQUENCES',
+        'avoid': 'reasons, examples, details, comparisons',
+        'keywords': ['effect', 'impact', 'consequence', 'result']
+    },
+    'comparison': {
+        'focus': 'COMPARISON with alternatives',
+        'avoid': 'reasons, examples, details, effects',
+        'keywords': ['compare', 'versus', 'difference', 'alternative']
+    }
+})
+
+_TYPE_BOUNDARIES_MULTILINGUAL = MappingProxyType({
+    "reason": {
+        "focus": "why they think/feel this way",
+        "avoid": "examples, details, effects, comparisons"
+    },
+    "impact": {
+        "focus": "effects or consequences", 
+        "avoid": "reasons, examples, details, comparisons"
+    },
+    "elaboration": {
+        "focus": "more details about their response",
+        "avoid": "examples, reasons, effects, comparisons"
+    },
+    "example": {
+        "focus": "specific examples or instances",
+        "avoid": "reasons, details, effects, comparisons"
+    },
+    "clarification": {
+        "focus": "clarify unclear terms or concepts",
+        "avoid": "examples, details, reasons, effects"
+    },
+    "comparison": {
+        "focus": "compare with alternatives",
+        "avoid": "reasons, examples, details, effects"
+    }
+})
+
+_TYPE_BOUNDARIES_THEME = MappingProxyType({
+    'reason': {
+        'focus': 'WHY they think/feel this way about the theme',
+        'avoid': 'examples, details, effects, comparisons',
+        'keywords': ['why', 'reason', 'motivation', 'thinking', 'feeling']
+    },
+    'clarification': {
+        'focus': 'CLARIFY unclear terms or concepts related to the theme',
+        'avoid': 'examples, details, reasons, effects',
+        'keywords': ['clarify', 'mean', 'understand', 'explain']
+    },
+    'elaboration': {
+        'focus': 'MORE DETAILS about their response regarding the theme',
+        'avoid': 'examples, reasons, effects, comparisons',
+        'keywords': ['details', 'more', 'expand', 'elaborate']
+    },
+    'example': {
+        'focus': 'SPECIFIC EXAMPLES or instances of the theme',
+        'avoid': 'reasons, details, effects, comparisons',
+        'keywords': ['example', 'instance', 'case', 'specific']
+    },
+    'impact': {
+        'focus': 'EFFECTS or CONSEQUENCES of the theme',
+        'avoid': 'reasons, examples, details, comparisons',
+        'keywords': ['effect', 'impact', 'consequence', 'result']
+    },
+    'comparison': {
+        'focus': 'COMPARISON with alternatives related to the theme',
+        'avoid': 'reasons, examples, details, effects',
+        'keywords': ['compare', 'versus', 'difference', 'alternative']
+    }
+})
+
+
+# Words that imply a theme without naming it, for the string-match fallback
+_SEMANTIC_MAPPINGS = MappingProxyType({
+    "collaboration": ["together", "teamwork", "cooperate", "joint", "shared"],
+    "communication": ["talk", "speak", "discuss", "conversation", "meeting", "email"],
+    "leadership": ["manage", "lead", "guide", "direct", "supervise", "oversee"],
+    "teamwork": ["collaborate", "together", "group", "team", "coordinate"],
+    "innovation": ["creative", "new", "improve", "develop", "design", "invent"]
+})
+
+# Non-informative answer phrases per language. Shared by the prompt
+# builder and by the local pre-filter below.
+_NON_INFORMATIVE_PATTERNS = {
+    "English": [
+        "i don't know", "idk", "dunno", "n/a", "none", "nothing", "no idea", "not applicable", "skip", "pass",
+        "i don't care", "whatever", "no comment", "no response", "blank", "empty", "no answer",
+        "not sure", "maybe", "possibly", "perhaps", "no preference", "no opinion", "neutral",
+        "don't have one", "haven't thought about it", "no thoughts", "no input", "no feedback",
+        "no experience", "never used", "not familiar", "don't use", "not applicable to me",
+        "doesn't apply", "not relevant", "no interest", "don't care", "indifferent"
+    ],
+    "Chinese": [
+        "我不知道", "不知道", "不晓得", "没有", "无", "跳过", "不适用", "无所谓", "没意见",
+        "不确定", "可能", "也许", "没想法", "没经验", "没用过", "不熟悉", "不关心",
+        "没兴趣", "不相关", "不适用", "没回答", "空白", "没反馈", "没想法"
+    ],
+    "Japanese": [
+        "わかりません", "知りません", "不明", "なし", "無し", "スキップ", "該当なし", "どうでもいい",
+        "意見なし", "わからない", "たぶん", "もしかして", "考えなし", "経験なし", "使ったことない",
+        "不慣れ", "興味なし", "関係ない", "適用外", "回答なし", "空白", "フィードバックなし"
+    ],
+    "Spanish": [
+        "no sé", "no lo sé", "ninguno", "nada", "no idea", "saltar", "no aplica", "no me importa",
+        "no tengo opinión", "no estoy seguro", "tal vez", "quizás", "no tengo preferencia",
+        "no tengo experiencia", "no he usado", "no estoy familiarizado", "no me interesa",
+        "no es relevante", "no aplica a mí", "no tengo comentarios", "en blanco", "sin respuesta"
+    ],
+    "French": [
+        "je ne sais pas", "aucun", "rien", "passer", "ne s'applique pas", "je m'en fiche",
+        "pas d'avis", "pas sûr", "peut-être", "pas de préférence", "pas d'expérience",
+        "jamais utilisé", "pas familier", "pas intéressé", "pas pertinent", "pas applicable",
+        "pas de commentaire", "vide", "sans réponse", "indifférent", "neutre"
+    ],
+    "German": [
+        "ich weiß nicht", "weiß nicht", "keiner", "nichts", "überspringen", "nicht zutreffend",
+        "ist mir egal", "keine Meinung", "nicht sicher", "vielleicht", "keine Präferenz",
+        "keine Erfahrung", "nie benutzt", "nicht vertraut", "nicht interessiert",
+        "nicht relevant", "nicht anwendbar", "kein Kommentar", "leer", "keine Antwort",
+        "gleichgültig", "neutral"
+    ],
+    "Korean": [
+        "모르겠어요", "모름", "없음", "아무것도", "건너뛰기", "해당없음", "상관없어요", "의견없음",
+        "확실하지 않아요", "아마도", "어쩌면", "선호도 없음", "경험 없음", "사용해본 적 없음",
+        "익숙하지 않음", "관심 없음", "관련 없음", "해당 안됨", "댓글 없음", "빈칸", "답변 없음",
+        "무관심", "중립"
+            ]
+}
+
+
+# NFKC-casefolded phrase sets for local classification: full-width and
+# composed variants of the same phrase collapse to one canonical form,
+# so membership is a single O(1) lookup
+_NONINFORM_SETS = MappingProxyType({
+    language: frozenset(
+        unicodedata.normalize("NFKC", phrase).casefold() for phrase in phrases
+    )
+    for language, phrases in _NON_INFORMATIVE_PATTERNS.items()
+})
+_NONINFORM_ALL = frozenset().union(*_NONINFORM_SETS.values())
+
+# The most common trivial answers, packed into space-padded uint64s so a
+# short response collapses to one integer load + set lookup before any
+# automaton scan
+_TRIVIAL_8 = frozenset(
+    int.from_bytes(word.ljust(8, b' '), 'little')
+    for word in (b'idk', b'n/a', b'none', b'nothing', b'skip', b'pass', b'dunno')
+)
+
+
+def _build_noninform_automaton(pattern_sets: tuple) -> "ahocorasick.Automaton":
+    """Compile the given non-informative phrase sets into one automaton."""
+    automaton = ahocorasick.Automaton()
+    for patterns in pattern_sets:
+        for pattern in patterns:
+            automaton.add_word(pattern, pattern)
+    automaton.make_automaton()
+    return automaton
+
+
+# Per-language automatons keep e.g. Spanish "nada" from firing on an
+# English answer; the union automaton covers unknown languages
+_NONINFORM_AUTOMATA = MappingProxyType({
+    language: _build_noninform_automaton((patterns,))
+    for language, patterns in _NONINFORM_SETS.items()
+})
+_NONINFORM_AUTOMATON = _build_noninform_automaton(tuple(_NONINFORM_SETS.values()))
+
+# Fixed-shape questions for the "no themes detected" branch. The LLM
+# output for this prompt is nearly always this template, so for known
+# languages we can skip the API call entirely. Disable by setting
+# OPENAI_MISSING_THEME_TEMPLATES=0.
+_MISSING_THEME_TEMPLATES = {
+    "English": "Why didn't you mention {theme}? It's an important aspect — what are your thoughts on it?",
+    "Spanish": "¿Por qué no mencionaste {theme}? Es un aspecto importante, ¿qué opinas al respecto?",
+    "French": "Pourquoi n'avez-vous pas mentionné {theme} ? C'est un aspect important — qu'en pensez-vous ?",
+    "German": "Warum haben Sie {theme} nicht erwähnt? Es ist ein wichtiger Aspekt — was denken Sie darüber?",
+    "Chinese": "您为什么没有提到{theme}？这是一个重要方面，您对它有什么看法？",
+    "Japanese": "なぜ{theme}について触れなかったのですか？重要な側面ですが、どのようにお考えですか？",
+}
+
+_USE_MISSING_THEME_TEMPLATES = os.getenv("OPENAI_MISSING_THEME_TEMPLATES", "1") != "0"
+
+# Responses shorter than this are non-informative without any API call
+_MIN_INFORMATIVE_LEN = int(os.getenv("OPENAI_MIN_INFORMATIVE_LEN", "4"))
+
+# Coalesce concurrent /generate-followup calls into one multi-item API
+# request. Off by default: packing several generation prompts into one
+# completion trades some per-item quality for fewer round-trips, which
+# only pays off under sustained bursty load.
+_USE_FOLLOWUP_BATCHING = os.getenv("OPENAI_FOLLOWUP_BATCHING", "0") == "1"
+
+# Speculatively generate the question for the top-importance theme while
+# theme detection is still in flight (check_informative=False path only).
+# Off by default: a wrong guess burns the speculative call's tokens.
+_SPECULATIVE_THEME_GEN = os.getenv("OPENAI_SPECULATIVE_THEME", "0") == "1"
+
+# Constant template for theme detection; only the response and themes
+# list vary per call, so the invariant body is built once at import time
+# Static system prompts. Everything invariant (rules, examples, output
+# shape) lives here so the server-side prompt prefix cache sees an
+# identical prefix on every call; only the short user tail varies.
+_SYS_THEME_DETECT = """Analyze the user's response for theme matches with FLEXIBLE matching.
+
+Look for:
+1. EXACT matches: "communication" matches "communication"
+2. PARTIAL matches: "team communication" matches "communication"
+3. RELATED concepts: "talking to colleagues" matches "communication"
+4. SYNONYMS: "leading the team" matches "leadership"
+5. SEMANTIC similarity: "managing people" matches "leadership"
+6. CONTEXTUAL relevance: "email and meetings" matches "communication"
+7. SEMANTIC WORDS: "work together" matches "collaboration", "teamwork" matches "collaboration"
+
+Be VERY GENEROUS in matching - if the response is even slightly related to a theme, consider it a match.
+Look for semantic relationships, not just exact words.
+
+Return ONLY a JSON object like this:
+{"theme_name": "theme_name", "importance": importance_number}
+
+If no themes are found, return:
+{"theme_name": "none", "importance": 0}
+
+Examples:
+- Response: "I use email and Slack" → matches "communication" (partial match)
+- Response: "I manage a team" → matches "leadership" (semantic match)
+- Response: "We work together" → matches "collaboration" (semantic words)
+- Response: "I talk to my boss" → matches "communication" (contextual)
+- Response: "We share information" → matches "collaboration" (semantic)
+
+Choose the theme with the highest importance if multiple themes are found."""
+
+_SYS_INFORMATIVE_THEME = """Analyze the user's response in one pass:
+1. Is the response informative enough to ask follow-up questions? Be GENEROUS - if the response is relevant to the question, even if brief, it is informative.
+2. Which theme (if any) does the response match? Be flexible - exact, partial, and semantic matches all count. Choose the theme with the highest importance if several match.
+
+Return ONLY JSON: {"informative": 0 or 1, "theme_name": "theme_name or none", "importance": importance_number}"""
+
+_SYS_INFORMATIVE = """Analyze if the response is informative. Be GENEROUS in your assessment.
+
+IMPORTANT GUIDELINES:
+- Focus on RELEVANCE to the question, not length
+- Even brief responses can be informative if they address the question
+- Only classify as non-informative if the response shows no engagement with the question (e.g. "i don't know", "whatever", "no comment")
+
+Return ONLY '1' for informative or '0' for non-informative."""
+
+_SYS_THEME_QUESTION = "Generate a follow-up question in the requested language that focuses on the detected theme and follows the specified question type. Return the question and explanation separately."
+
+_SYS_MISSING_THEME = "Generate a follow-up question in the requested language about missing important themes."
+
+# Static part of the creative-generation payloads; each call only adds
+# its messages on top instead of rebuilding the fixed keys.
+_GEN_PAYLOAD_SKELETON = MappingProxyType({
+    "model": "gpt-4o-mini",
+    "temperature": 0.7,
+    "max_tokens": 200,
+    "top_p": 0.9,
+})
+
+
+_WS_RE = re.compile(r"\s+")
+_PUNCT_RE = re.compile(r"[^\w\s]")
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_for_cache(text: str) -> str:
+    """
+    Canonicalize free text for cache keys.
+
+    Survey answers repeat heavily with trivial variation ("Good product!",
+    "good product"); NFKC + casefold + punctuation/whitespace collapse
+    folds those variants onto one cache entry, lifting hit rates without
+    any semantic-embedding machinery.
+    """
+    text = _PUNCT_RE.sub("", unicodedata.normalize("NFKC", text).casefold())
+    return _WS_RE.sub(" ", text).strip()
+
+
+@functools.lru_cache(maxsize=256)
+def _canonical_themes_key(theme_items: tuple) -> str:
+    """
+    Render a sorted name:importance key, memoized per theme tuple.
+
+    Sorting makes the key order-insensitive, so callers passing the same
+    themes in a different order still hit the same cache entries.
+    """
+    return "|".join(f"{name}:{importance}" for name, importance in sorted(theme_items))
+
+
+@functools.lru_cache(maxsize=128)
+def _theme_fallback_regex(theme_items: tuple) -> tuple:
+    """
+    Compile one alternation regex covering every fallback match tier.
+
+    Each theme contributes its full name (tier 0), its words longer than
+    3 chars (tier 1), and its semantic synonyms (tier 2), all as named
+    groups. One C-level scan then replaces the old nested-loop cascade;
+    the group map preserves the exact > partial > semantic priority.
+
+    Returns:
+        tuple: (compiled pattern, {group_name: (tier, ThemeResult)}).
+    """
+    parts = []
+    groups = {}
+    counter = 0
+    for name, importance in theme_items:
+        result = ThemeResult(theme_name=name, importance=importance)
+        name_lower = name.lower()
+        entries = [(0, name_lower)]
+        entries += [(1, word) for word in name_lower.split() if len(word) > 3 and word != name_lower]
+        entries += [(2, synonym) for synonym in _SEMANTIC_MAPPINGS.get(name_lower, ())]
+        for tier, word in entries:
+            group_name = f"g{counter}"
+            counter += 1
+            parts.append(f"(?P<{group_name}>{re.escape(word)})")
+            groups[group_name] = (tier, result)
+    return re.compile("|".join(parts), re.IGNORECASE), groups
+
+
+@functools.lru_cache(maxsize=128)
+def _themes_prompt_str(theme_items: tuple) -> str:
+    """Render the themes list for prompts, memoized per theme tuple."""
+    return ", ".join(f"'{name}' (importance: {importance}%)" for name, importance in theme_items)
+
+
+@functools.lru_cache(maxsize=128)
+def _theme_automaton(theme_items: tuple) -> "ahocorasick.Automaton":
+    """
+    Build an Aho-Corasick automaton over lowercase theme names and
+    their known semantic synonyms.
+
+    Memoized per (name, importance) tuple so repeated requests with the
+    same theme list reuse the compiled automaton.
+    """
+    automaton = ahocorasick.Automaton()
+    for name, importance in theme_items:
+        result = ThemeResult(theme_name=name, importance=importance)
+        automaton.add_word(name.lower(), result)
+        # Known synonym words map to the same theme, so "work together"
+        # resolves to "collaboration" without an API call
+        for synonym in _SEMANTIC_MAPPINGS.get(name.lower(), ()):
+            automaton.add_word(synonym, result)
+    automaton.make_automaton()
+    return automaton
+
+
+# Single-pass cleaners for question text pulled out of JSON-ish replies
+_TEXT_PREFIX_RE = re.compile(r'^"text"\s*:\s*')
+_ESCAPE_RE = re.compile(r'\\(["n])')
+
+# One multi-alternation scan replaces the per-type / per-question-word
+# substring loops in the plain-text fallback extractor
+# Single multiline pass for the plain-text fallback parse: strips list
+# numbering, keeps only lines containing a question word, and captures an
+# optional type hint, all in one scan of the content
+_EXTRACT_RE = re.compile(
+    r'^[\s\d.\-*]*(?P<line>(?=.*(?:what|how|why|when|where|which|who|\?))'
+    r'(?:.*?(?P<type>reason|clarification|elaboration|example|impact|comparison))?.*)$',
+    re.IGNORECASE | re.MULTILINE)
+
+# Matches "Question: ..." optionally followed by "Explanation: ..." in a
+# theme-question reply, in a single pass instead of a line-by-line scan.
+_QUESTION_EXPLANATION_RE = re.compile(
+    r'question:\s*(?P<question>.*?)(?:\n\s*explanation:\s*(?P<explanation>.*))?\Z',
+    re.IGNORECASE | re.DOTALL
+)
 
 class OpenAIAPIError(Exception):
     """
@@ -24,6 +574,7 @@ class OpenAIService:
     TIMEOUT = 15  # Reduced timeout for faster response
     RETRIES = 1   # Keep retries for reliability
     MAX_TOKENS = 100  # Reduced for faster generation
+    NEGATIVE_CACHE_TTL = 5  # Seconds to back off after a failed prompt
 
     def __init__(self):
         """
@@ -34,7 +585,14 @@ class OpenAIService:
         if not self.api_key:
             raise ValueError("OpenAI API key not provided in environment variables.")
         self.logger = logging.getLogger("OpenAIService")
-        
+
+        # Request headers never change after init; build the mapping once
+        # and hand the same read-only view to every API call
+        self._headers = MappingProxyType({
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        })
+
         # Create a session with connection pooling for better performance
         self.session = requests.Session()
         
@@ -46,79 +604,177 @@ class OpenAIService:
             backoff_factor=0.1  # Faster backoff for speed
         )
         
-        # Configure adapter with optimized connection pooling
+        # All traffic goes to one host, so a single pool with a large
+        # maxsize is what matters. pool_block=True applies backpressure
+        # instead of discarding connections above maxsize, which would
+        # force a fresh TLS handshake on the next request
         adapter = HTTPAdapter(
             max_retries=retry_strategy,
-            pool_connections=20,  # Optimized for typical load
-            pool_maxsize=50,      # Optimized for typical load
-            pool_block=False      # Don't block on connection pool exhaustion
+            pool_connections=1,
+            pool_maxsize=int(os.getenv("OPENAI_POOL_MAXSIZE", "100")),
+            pool_block=True
         )
-        
+
         self.session.mount("https://", adapter)
         self.session.mount("http://", adapter)
-        
-        # Pre-warm connection pool for faster initial requests
-        try:
-            self.session.get("https://api.openai.com", timeout=1)
-        except:
-            pass  # Ignore pre-warm failures
-        
-        # Optimized in-memory cache for performance
-        self.cache = {}
+
+        # Responses are several KB of JSON; make compression explicit.
+        # Auth and content-type ride on the session too, applied once
+        # here instead of per call
+        self.session.headers['Accept-Encoding'] = 'gzip, deflate'
+        self.session.headers.update(self._headers)
+
+        # Optimized in-memory LRU cache: insertion order doubles as
+        # recency order, so eviction is O(1) instead of a full scan
+        self.cache: "OrderedDict[str, tuple]" = OrderedDict()
         self.cache_ttl = 600  # 10 minutes for better caching
+        # Integer nanosecond TTL against the monotonic clock: immune to
+        # wall-clock jumps and avoids float math on every lookup
+        self.cache_ttl_ns = self.cache_ttl * 1_000_000_000
         self.cache_max_size = 1000  # Larger cache for better hit rates
+        # Min-heap of (expiry_ns, key): cleanup_cache pops only entries
+        # that are actually due instead of scanning the whole cache
+        self._expiry_heap: list = []
+
+        # Singleflight map: concurrent callers with the same cache key
+        # share one in-flight API call instead of issuing duplicates
+        self._inflight: Dict[str, concurrent.futures.Future] = {}
+        self._inflight_lock = threading.Lock()
+
+        # Recently failed prompt keys, for short-TTL negative caching
+        self._negative_cache: Dict[str, float] = {}
+
+        # Optional cross-process cache layer (see app/llm_cache.py);
+        # None unless OPENAI_CACHE_BACKEND selects a backend
+        self._persistent_cache = get_cache_backend()
+        self.cache_stats = {"hits": 0, "misses": 0}
 
     def _get_headers(self) -> Dict[str, str]:
-        return {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
+        return self._headers
 
     def _get_cache_key(self, prompt: str) -> str:
         """Generate cache key for the prompt."""
-        return hashlib.md5(prompt.encode()).hexdigest()
+        if self._persistent_cache is not None:
+            # Keys that reach the persistent backend must be stable across
+            # processes; CPython's str hash is randomized per interpreter,
+            # so entries written by one worker would be unreachable from
+            # any other. sha256 of the key string is deterministic.
+            return hashlib.sha256(prompt.encode()).hexdigest()
+        # Cache keys need speed, not cryptographic strength. Without a
+        # persistent backend the cache is purely in-process, so the
+        # interpreter's own siphash of the str (computed in C, no UTF-8
+        # encode, no intermediate bytes object) plus the length
+        # disambiguator is sufficient.
+        return f"{hash(prompt):x}:{len(prompt)}"
+
+    @staticmethod
+    def _themes_key(themes: list) -> str:
+        """Order-insensitive canonical form of a themes list for cache keys."""
+        return _canonical_themes_key(tuple((t["name"], t["importance"]) for t in themes))
     
     def _get_cached_response(self, cache_key: str) -> Optional[Dict[str, Any]]:
         """Get cached response if available and not expired."""
         if cache_key in self.cache:
             cached_data, timestamp = self.cache[cache_key]
-            if time.time() - timestamp < self.cache_ttl:
+            if time.monotonic_ns() - timestamp < self.cache_ttl_ns:
+                # Refresh recency so hot entries survive eviction
+                self.cache.move_to_end(cache_key)
+                self.cache_stats["hits"] += 1
                 self.logger.info("Returning cached response")
                 return cached_data
             else:
                 del self.cache[cache_key]
+        if self._persistent_cache is not None:
+            value = self._persistent_cache.get(cache_key)
+            if value is not None:
+                # Promote to the in-memory layer for subsequent lookups
+                self.cache[cache_key] = (value, time.monotonic_ns())
+                self.cache_stats["hits"] += 1
+                return value
+        self.cache_stats["misses"] += 1
         return None
-    
-    def _cache_response(self, cache_key: str, response: Dict[str, Any]):
-        """Cache the response with timestamp and size management."""
-        # Clean up cache if it's getting too large
-        if len(self.cache) >= self.cache_max_size:
-            self.cleanup_cache()
-        
-        self.cache[cache_key] = (response, time.time())
-    
-    def generate_questions(self, prompt: str) -> Dict[str, Any]:
+
+    def _cache_response(self, cache_key: str, response: Dict[str, Any], persist: bool = False):
         """
-        Call OpenAI API to generate follow-up questions.
+        Cache the response with timestamp and LRU size management.
+
+        Only deterministic (temperature 0.0) results should set persist:
+        creative generations are not reproducible, so sharing them across
+        workers has no dedup value and just bloats the backend.
+        """
+        # Evict least-recently-used entries in O(1) instead of scanning
+        # the whole cache on the write path
+        while len(self.cache) >= self.cache_max_size:
+            self.cache.popitem(last=False)
+
+        now_ns = time.monotonic_ns()
+        self.cache[cache_key] = (response, now_ns)
+        heapq.heappush(self._expiry_heap, (now_ns + self.cache_ttl_ns, cache_key))
+        # Drain due heap entries here too: cleanup_cache only runs when
+        # /performance is polled, and without this the heap would grow for
+        # the life of the process. Amortized O(log n) per write.
+        self._purge_expired(now_ns)
+
+        if persist and self._persistent_cache is not None:
+            try:
+                self._persistent_cache.set(cache_key, response, self.cache_ttl)
+            except Exception as exc:
+                # A broken persistent layer must never fail the request
+                self.logger.warning(f"Persistent cache write failed: {exc}")
+
+    @staticmethod
+    def _extract_content(data: Dict[str, Any]) -> str:
+        """
+        Pull the first choice's message content from an API response.
 
         Args:
-            prompt (str): The prompt to send to the LLM.
+            data (Dict[str, Any]): Decoded chat-completion response body.
 
         Returns:
-            Dict[str, Any]: The API response JSON.
+            str: The message content (may be empty).
 
         Raises:
-            OpenAIAPIError: If the API call fails.
+            OpenAIAPIError: If the response shape is missing choices/message.
         """
-        # Check cache first
-        cache_key = self._get_cache_key(prompt)
-        cached_response = self._get_cached_response(cache_key)
-        if cached_response:
-            return cached_response
-        
-        # Track performance
-        start_time = time.time()
-        payload = {
+        try:
+            return data["choices"][0]["message"]["content"]
+        except (KeyError, IndexError, TypeError):
+            raise OpenAIAPIError("Malformed OpenAI API response: no message content.")
+
+    def _singleflight(self, cache_key: str, producer):
+        """
+        Run producer once for all concurrent callers sharing cache_key.
+
+        The first caller executes producer; callers arriving while it is
+        in flight block on the same Future and share its result (or its
+        exception).
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(cache_key)
+            if future is not None:
+                owner = False
+            else:
+                future = concurrent.futures.Future()
+                self._inflight[cache_key] = future
+                owner = True
+
+        if not owner:
+            return future.result()
+
+        try:
+            result = producer()
+            future.set_result(result)
+            return result
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(cache_key, None)
+
+    def _build_questions_payload(self, prompt: str) -> Dict[str, Any]:
+        """Build the chat-completion payload for follow-up question generation."""
+        return {
             "model": "gpt-4o-mini",
             "messages": [
                 {
@@ -133,22 +789,73 @@ class OpenAIService:
             "temperature": 0.01,  # Even lower temperature for fastest responses
             "max_tokens": self.MAX_TOKENS,
             "top_p": 0.3,        # Lower for faster generation
-            "frequency_penalty": 0.0,
-            "presence_penalty": 0.0,
-            "stream": False      # Keep no streaming for faster response
         }
+
+    def _build_multilingual_payload(self, prompt: str, language: str) -> Dict[str, Any]:
+        """Build the chat-completion payload for multilingual question generation."""
+        return {
+            "model": "gpt-4o-mini",
+            "messages": [
+                {
+                    "role": "system",
+                    "content": f"Generate 1 question in {language}. Return only the question text."
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            "temperature": 0.05,  # Very low temperature for fastest responses
+            "max_tokens": 50,     # Further reduced for faster generation
+            "top_p": 0.7,        # Lower for faster generation
+        }
+
+    def generate_questions(self, prompt: str) -> Dict[str, Any]:
+        """
+        Call OpenAI API to generate follow-up questions.
+
+        Concurrent callers with an identical prompt share one in-flight
+        API call, and prompts that just failed are rejected locally for a
+        short window instead of hammering the API again.
+
+        Args:
+            prompt (str): The prompt to send to the LLM.
+
+        Returns:
+            Dict[str, Any]: The API response JSON.
+
+        Raises:
+            OpenAIAPIError: If the API call fails or failed very recently.
+        """
+        cache_key = self._get_cache_key(f"questions:{prompt}")
+
+        failed_at = self._negative_cache.get(cache_key)
+        if failed_at is not None:
+            if time.time() - failed_at < self.NEGATIVE_CACHE_TTL:
+                raise OpenAIAPIError("Identical request failed moments ago; backing off.")
+            del self._negative_cache[cache_key]
+
+        try:
+            return self._singleflight(cache_key, lambda: self._generate_questions_api(prompt))
+        except OpenAIAPIError:
+            self._negative_cache[cache_key] = time.time()
+            raise
+
+    def _generate_questions_api(self, prompt: str) -> Dict[str, Any]:
+        """Issue the follow-up question API call (no caching or coalescing)."""
+        # Track performance
+        start_time = time.time()
+        payload = self._build_questions_payload(prompt)
         try:
             response = self.session.post(
                 self.API_URL,
-                headers=self._get_headers(),
-                json=payload,
+                data=orjson.dumps(payload),
                 timeout=self.TIMEOUT
             )
             if response.status_code == 200:
-                response_data = response.json()
-                # Cache the successful response
-                self._cache_response(cache_key, response_data)
-                
+                # orjson skips the encoding-detection path response.json() triggers
+                response_data = orjson.loads(response.content)
+
                 # Log performance metrics
                 elapsed_time = time.time() - start_time
                 self.logger.info(f"OpenAI API call completed in {elapsed_time:.2f}s")
@@ -161,17 +868,138 @@ class OpenAIService:
             self.logger.error(f"OpenAI API request failed: {exc}")
             raise OpenAIAPIError(f"Request failed: {exc}")
     
+    def generate_followups(self, prompt: str, allowed_types: Optional[list] = None) -> list:
+        """
+        Generate and parse follow-up questions, caching the parsed result.
+
+        Caching the small parsed question list instead of the raw API JSON
+        keeps the cache footprint 5-10x smaller per entry, and keying on the
+        allowed types means different type subsets don't collide.
+
+        Args:
+            prompt (str): The prompt to send to the LLM.
+            allowed_types (Optional[list]): List of allowed question types.
+
+        Returns:
+            list: List of question dictionaries with 'type' and 'text' fields.
+
+        Raises:
+            OpenAIAPIError: If the API call or parsing fails.
+        """
+        cache_key = self._get_cache_key(f"{prompt}:{tuple(allowed_types) if allowed_types else ()}")
+        cached_followups = self._get_cached_response(cache_key)
+        if cached_followups:
+            return cached_followups
+
+        if _USE_FOLLOWUP_BATCHING:
+            followups = self._singleflight(
+                cache_key,
+                lambda: self._get_followup_batcher().submit(prompt, allowed_types).result(timeout=self.TIMEOUT * 2)
+            )
+        else:
+            api_response = self.generate_questions(prompt)
+            followups = self.parse_response(api_response, allowed_types)
+        self._cache_response(cache_key, followups)
+        return followups
+
+    def _get_followup_batcher(self) -> "_FollowupBatcher":
+        """Lazily create the shared follow-up generation batcher."""
+        if getattr(self, "_followup_batcher", None) is None:
+            self._followup_batcher = _FollowupBatcher(self)
+        return self._followup_batcher
+
+    def _generate_followups_batch_api(self, items: list) -> list:
+        """
+        Generate follow-up question lists for several prompts in one call.
+
+        Args:
+            items (list): List of (prompt, allowed_types) tuples.
+
+        Returns:
+            list: Per-item followup lists, in input order.
+        """
+        sections = "\n\n---\n\n".join(
+            f"Item {idx}:\n{prompt}" for idx, (prompt, _) in enumerate(items, start=1)
+        )
+        batch_prompt = f"""Answer every numbered item below independently.
+
+{sections}
+
+Return ONLY a JSON array with one object per item, like:
+[{{"id": 1, "followups": [{{"type": "type", "text": "question"}}]}}]"""
+
+        payload = {
+            "model": "gpt-4o-mini",
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "You generate survey follow-up questions. Return ONLY the requested JSON array."
+                },
+                {"role": "user", "content": batch_prompt}
+            ],
+            "temperature": 0.7,
+            "max_tokens": self.MAX_TOKENS * len(items)
+        }
+
+        api_response = self.session.post(
+            self.API_URL,
+            data=orjson.dumps(payload),
+            timeout=self.TIMEOUT
+        )
+        if api_response.status_code >= 400:
+            raise OpenAIAPIError(f"HTTP {api_response.status_code}: {api_response.text[:200]}")
+        content = self._extract_content(orjson.loads(api_response.content)).strip()
+
+        json_match = _JSON_ARR_RE.search(content)
+        if not json_match:
+            raise ValueError(f"No JSON array in batched followup response: {content}")
+        by_id = {
+            int(entry["id"]): entry.get("followups", [])
+            for entry in orjson.loads(json_match.group(0))
+            if isinstance(entry, dict) and "id" in entry
+        }
+
+        results = []
+        for idx, (_, allowed_types) in enumerate(items, start=1):
+            followups = [
+                {"type": f["type"], "text": f["text"]}
+                for f in by_id.get(idx, [])
+                if isinstance(f, dict) and f.get("type") and f.get("text")
+            ]
+            expected = len(allowed_types) if allowed_types else 6
+            results.append(self._ensure_questions(followups, expected, allowed_types))
+        return results
+
+    def _purge_expired(self, now_ns: int) -> int:
+        """
+        Pop due expiry-heap entries and evict the ones still stale.
+
+        The heap makes this O(log n) per expired entry instead of a full
+        cache scan. A key can appear in the heap more than once
+        (re-cached entries), and LRU eviction can remove a key before
+        its heap entry comes due, so re-check the live timestamp before
+        deleting.
+
+        Args:
+            now_ns (int): Current time.monotonic_ns() reading.
+
+        Returns:
+            int: Number of cache entries evicted.
+        """
+        removed = 0
+        while self._expiry_heap and self._expiry_heap[0][0] <= now_ns:
+            _, key = heapq.heappop(self._expiry_heap)
+            entry = self.cache.get(key)
+            if entry is not None and now_ns - entry[1] > self.cache_ttl_ns:
+                del self.cache[key]
+                removed += 1
+        return removed
+
     def cleanup_cache(self):
         """Clean up expired cache entries."""
-        current_time = time.time()
-        expired_keys = [
-            key for key, (_, timestamp) in self.cache.items()
-            if current_time - timestamp > self.cache_ttl
-        ]
-        for key in expired_keys:
-            del self.cache[key]
-        if expired_keys:
-            self.logger.info(f"Cleaned up {len(expired_keys)} expired cache entries")
+        removed = self._purge_expired(time.monotonic_ns())
+        if removed:
+            self.logger.info(f"Cleaned up {removed} expired cache entries")
 
     def _clean_question_text(self, text: str) -> str:
         """
@@ -185,29 +1013,17 @@ class OpenAIService:
         """
         if not text:
             return text
-            
-        # Remove "text": " prefix and trailing quotes
-        if text.startswith('"text": "') and text.endswith('"'):
-            text = text[8:-1]  # Remove "text": " and trailing "
-        elif text.startswith('"text":'):
-            text = text[7:].strip().strip('"')
-        
-        # Remove any remaining JSON artifacts
-        text = text.replace('\\"', '"')  # Unescape quotes
-        text = text.replace('\\n', ' ')  # Replace newlines with spaces
-        
-        # Remove any remaining quotes at the beginning or end
-        text = text.strip().strip('"').strip("'")
-        
-        # Remove any leading quotes that might still be there
-        while text.startswith('"') or text.startswith("'"):
-            text = text[1:]
-        
-        # Remove any trailing quotes
-        while text.endswith('"') or text.endswith("'"):
-            text = text[:-1]
-        
-        return text.strip()
+
+        # Remove a leading "text": prefix in one precompiled match
+        prefix = _TEXT_PREFIX_RE.match(text)
+        if prefix:
+            text = text[prefix.end():]
+
+        # Unescape quotes and turn escaped newlines into spaces in one pass
+        text = _ESCAPE_RE.sub(lambda m: '"' if m.group(1) == '"' else ' ', text)
+
+        # Strip surrounding whitespace and any leading/trailing quotes
+        return text.strip().strip('"\'').strip()
 
     def parse_response(self, api_response: dict, allowed_types: Optional[list] = None) -> list:
         """
@@ -240,11 +1056,10 @@ class OpenAIService:
                 expected_count = 6  # Default to all 6 types
             
             # Try to parse JSON from the content
-            import json
             try:
                 # First, try to parse the entire content as JSON
                 try:
-                    parsed = json.loads(content.strip())
+                    parsed = orjson.loads(content.strip())
                     questions = parsed.get("followups", [])
                     if isinstance(questions, list) and questions:
                         # Convert question types to lowercase to match enum and clean text
@@ -266,7 +1081,7 @@ class OpenAIService:
                         
                         # Ensure we have exactly the expected number of questions with the required types
                         return self._ensure_questions(questions, expected_count, allowed_types)
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     pass
                 
                 # If that fails, look for JSON within the content
@@ -275,7 +1090,7 @@ class OpenAIService:
                 if start_idx != -1 and end_idx > start_idx:
                     json_str = content[start_idx:end_idx]
                     try:
-                        parsed = json.loads(json_str)
+                        parsed = orjson.loads(json_str)
                         questions = parsed.get("followups", [])
                         if isinstance(questions, list) and questions:
                             # Convert question types to lowercase to match enum and clean text
@@ -297,7 +1112,7 @@ class OpenAIService:
                             
                             # Ensure we have exactly the expected number of questions with the required types
                             return self._ensure_questions(questions, expected_count, allowed_types)
-                    except json.JSONDecodeError:
+                    except orjson.JSONDecodeError:
                         pass
                 
                 # If JSON parsing fails, try to extract questions from plain text
@@ -338,63 +1153,42 @@ class OpenAIService:
             required_types = all_types[:expected_count]
         
         result = []
-        
-        # Type mapping for similar types
-        type_mapping = {
-            'why': 'reason',
-            'clarify': 'clarification',
-            'explain': 'clarification',
-            'elaborate': 'elaboration',
-            'details': 'elaboration',
-            'examples': 'example',
-            'instance': 'example',
-            'case': 'example',
-            'effects': 'impact',
-            'consequences': 'impact',
-            'results': 'impact',
-            'outcomes': 'impact',
-            'compare': 'comparison',
-            'versus': 'comparison',
-            'difference': 'comparison'
-        }
-        
-        # First, try to find questions with the exact required types
+
+        # Index questions once by exact type and by mapped canonical type,
+        # replacing the per-required-type rescans of the whole list
+        exact_index = {}
+        alias_index = {}
+        for question in questions:
+            if not isinstance(question, dict):
+                continue
+            question_type = question.get('type', '').lower()
+            exact_index.setdefault(question_type, []).append(question)
+            canonical = _TYPE_MAPPING.get(question_type)
+            if canonical:
+                alias_index.setdefault(canonical, []).append(question)
+
         for req_type in required_types:
-            found = False
-            for question in questions:
-                if isinstance(question, dict) and question.get('type', '').lower() == req_type:
-                    result.append(question)
-                    found = True
-                    self.logger.info(f"Found exact match for {req_type}")
-                    break
-            
-            # If not found, try to map similar types
-            if not found:
-                for question in questions:
-                    question_type = question.get('type', '').lower()
-                    if question_type in type_mapping and type_mapping[question_type] == req_type:
-                        # Update the type to the required type
-                        question['type'] = req_type
-                        result.append(question)
-                        found = True
-                        self.logger.info(f"Mapped {question_type} to {req_type}")
-                        break
-            
-            # If we still didn't find a question with this type, create a default one
-            if not found:
-                default_texts = {
-                    'reason': f"Why do you think this is the case?",
-                    'clarification': f"Can you clarify what you mean by this?",
-                    'elaboration': f"Can you provide more details about this?",
-                    'example': f"Can you give an example of this?",
-                    'impact': f"How does this affect you or others?",
-                    'comparison': f"How does this compare to other options?"
-                }
-                result.append({
-                    'type': req_type,
-                    'text': default_texts.get(req_type, f"Please provide more details about {req_type}.")
-                })
-                self.logger.info(f"Created default question for {req_type}")
+            bucket = exact_index.get(req_type)
+            if bucket:
+                result.append(bucket.pop(0))
+                self.logger.info(f"Found exact match for {req_type}")
+                continue
+
+            # Fall back to questions whose type maps to the required one
+            bucket = alias_index.get(req_type)
+            if bucket:
+                question = bucket.pop(0)
+                self.logger.info(f"Mapped {question.get('type', '')} to {req_type}")
+                question['type'] = req_type
+                result.append(question)
+                continue
+
+            # Still nothing with this type - create a default question
+            result.append({
+                'type': req_type,
+                'text': _DEFAULT_QUESTION_TEXTS.get(req_type, f"Please provide more details about {req_type}.")
+            })
+            self.logger.info(f"Created default question for {req_type}")
         
         # Ensure we have exactly the expected number of questions
         final_result = result[:expected_count]
@@ -412,40 +1206,22 @@ class OpenAIService:
             list: List of question dicts with 'type' and 'text'.
         """
         try:
-            # Split content into lines and look for questions
-            lines = content.strip().split('\n')
+            # One compiled multiline scan replaces the per-line strip /
+            # prefix-trim / question-word / type checks
             questions = []
-            
-            # Common question patterns
-            question_types = ['reason', 'clarification', 'elaboration', 'example', 'impact', 'comparison']
-            
-            for line in lines:
-                line = line.strip()
-                if not line or len(line) < 10:
+            for match in _EXTRACT_RE.finditer(content):
+                line = match.group('line').strip()
+                if len(line) < 10:
                     continue
-                    
-                # Remove numbering and common prefixes
-                line = line.lstrip('0123456789.-* ')
-                
-                # Clean up the line using the cleaning function
-                line = self._clean_question_text(line)
-                
-                # Determine question type based on content
-                question_type = 'reason'  # default
-                for qtype in question_types:
-                    if qtype in line.lower():
-                        question_type = qtype
-                        break
-                
-                # Check if it looks like a question
-                if any(word in line.lower() for word in ['what', 'how', 'why', 'when', 'where', 'which', 'who', '?']):
-                    questions.append({
-                        'type': question_type,  # Keep lowercase to match enum
-                        'text': line
-                    })
-            
-            return questions[:3]  # Return max 3 questions
-            
+                questions.append({
+                    'type': (match.group('type') or 'reason').lower(),
+                    'text': self._clean_question_text(line)
+                })
+                if len(questions) == 3:  # Return max 3 questions
+                    break
+
+            return questions
+
         except Exception as e:
             self.logger.error(f"Failed to extract questions from text: {e}")
             return []
@@ -470,38 +1246,7 @@ class OpenAIService:
             types_to_generate = ['reason', 'clarification', 'elaboration', 'example', 'impact', 'comparison']
         
         # Define strict boundaries for each question type (non-overlapping)
-        type_boundaries = {
-            'reason': {
-                'focus': 'WHY they think/feel this way about the response',
-                'avoid': 'examples, details, effects, comparisons',
-                'keywords': ['why', 'reason', 'motivation', 'thinking', 'feeling']
-            },
-            'clarification': {
-                'focus': 'CLARIFY unclear terms or concepts in the response',
-                'avoid': 'examples, details, reasons, effects',
-                'keywords': ['clarify', 'mean', 'understand', 'explain']
-            },
-            'elaboration': {
-                'focus': 'MORE DETAILS about their response',
-                'avoid': 'examples, reasons, effects, comparisons',
-                'keywords': ['details', 'more', 'expand', 'elaborate']
-            },
-            'example': {
-                'focus': 'SPECIFIC EXAMPLES or instances of what they mentioned',
-                'avoid': 'reasons, details, effects, comparisons',
-                'keywords': ['example', 'instance', 'case', 'specific']
-            },
-            'impact': {
-                'focus': 'EFFECTS or CONSEQUENCES of what they mentioned',
-                'avoid': 'reasons, examples, details, comparisons',
-                'keywords': ['effect', 'impact', 'consequence', 'result']
-            },
-            'comparison': {
-                'focus': 'COMPARISON with alternatives to what they mentioned',
-                'avoid': 'reasons, examples, details, effects',
-                'keywords': ['compare', 'versus', 'difference', 'alternative']
-            }
-        }
+        type_boundaries = _TYPE_BOUNDARIES_FOLLOWUP
         
         # Build the restrictive prompt
         restrictions_text = []
@@ -538,38 +1283,7 @@ Return JSON: {{"followups": [{{"type": "type", "text": "question"}}]}}"""
             str: The formatted restrictive prompt.
         """
         # Define strict boundaries for each question type
-        type_boundaries = {
-            'reason': {
-                'focus': 'WHY they think/feel this way',
-                'avoid': 'examples, details, effects, comparisons',
-                'keywords': ['why', 'reason', 'motivation', 'thinking', 'feeling']
-            },
-            'clarification': {
-                'focus': 'CLARIFY unclear terms or concepts',
-                'avoid': 'examples, details, reasons, effects',
-                'keywords': ['clarify', 'mean', 'understand', 'explain']
-            },
-            'elaboration': {
-                'focus': 'MORE DETAILS about their response',
-                'avoid': 'examples, reasons, effects, comparisons',
-                'keywords': ['details', 'more', 'expand', 'elaborate']
-            },
-            'example': {
-                'focus': 'SPECIFIC EXAMPLES or instances',
-                'avoid': 'reasons, details, effects, comparisons',
-                'keywords': ['example', 'instance', 'case', 'specific']
-            },
-            'impact': {
-                'focus': 'EFFECTS or CONSEQUENCES',
-                'avoid': 'reasons, examples, details, comparisons',
-                'keywords': ['effect', 'impact', 'consequence', 'result']
-            },
-            'comparison': {
-                'focus': 'COMPARISON with alternatives',
-                'avoid': 'reasons, examples, details, effects',
-                'keywords': ['compare', 'versus', 'difference', 'alternative']
-            }
-        }
+        type_boundaries = _TYPE_BOUNDARIES_RESTRICTIVE
         
         boundary = type_boundaries.get(question_type.lower(), {})
         focus = boundary.get('focus', question_type)
@@ -646,68 +1360,14 @@ Return only the question text."""
         """
         question_lower = question_text.lower()
         
-        # Define replacement patterns for each type
-        replacements = {
-            'reason': {
-                'example': 'reason',
-                'instance': 'reason',
-                'case': 'reason',
-                'such as': 'because',
-                'like when': 'because',
-                'specifically': 'in particular'
-            },
-            'clarification': {
-                'example': 'clarification',
-                'instance': 'clarification',
-                'case': 'clarification',
-                'effect': 'meaning',
-                'impact': 'meaning',
-                'specifically': 'precisely'
-            },
-            'elaboration': {
-                'example': 'details',
-                'instance': 'details',
-                'case': 'details',
-                'such as': 'in detail',
-                'like when': 'in detail',
-                'compare': 'expand on',
-                'specifically': 'in detail'
-            },
-            'example': {
-                'why': 'what',
-                'reason': 'instance',
-                'effect': 'example',
-                'impact': 'example',
-                'compare': 'example'
-            },
-            'impact': {
-                'example': 'effect',
-                'instance': 'effect',
-                'case': 'effect',
-                'why': 'how',
-                'reason': 'result',
-                'compare': 'effect',
-                'specifically': 'particularly'
-            },
-            'comparison': {
-                'example': 'alternative',
-                'instance': 'alternative',
-                'case': 'alternative',
-                'why': 'how',
-                'reason': 'difference',
-                'effect': 'difference',
-                'specifically': 'particularly'
-            }
-        }
         
         # Apply replacements
         fixed_text = question_text
-        replacements_dict = replacements.get(question_type.lower(), {})
+        replacements_dict = _TYPE_REPLACEMENTS.get(question_type.lower(), {})
         
         for old_word, new_word in replacements_dict.items():
             if old_word in question_lower:
                 # Replace the word while preserving case
-                import re
                 pattern = re.compile(re.escape(old_word), re.IGNORECASE)
                 fixed_text = pattern.sub(new_word, fixed_text)
         
@@ -740,63 +1400,18 @@ Return only the question text."""
         
         # Build optimized multilingual prompt
         prompt = self._build_multilingual_prompt(question, response, question_type, language)
-        
-        payload = {
-            "model": "gpt-4o-mini",
-            "messages": [
-                {
-                    "role": "system",
-                    "content": f"Generate 1 question in {language}. Return only the question text."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            "temperature": 0.05,  # Very low temperature for fastest responses
-            "max_tokens": 50,     # Further reduced for faster generation
-            "top_p": 0.7,        # Lower for faster generation
-            "frequency_penalty": 0.0,
-            "presence_penalty": 0.0,
-            "stream": False      # Keep no streaming for faster response
-        }
+
+        payload = self._build_multilingual_payload(prompt, language)
 
         try:
             response = self.session.post(
                 self.API_URL,
-                headers=self._get_headers(),
-                json=payload,
+                data=orjson.dumps(payload),
                 timeout=self.TIMEOUT
             )
             if response.status_code == 200:
-                response_data = response.json()
-                
-                # Extract the question text directly
-                content = response_data.get("choices", [{}])[0].get("message", {}).get("content", "")
-                if not content:
-                    raise OpenAIAPIError("No content in multilingual response.")
-                
-                # Clean up the response (remove quotes, extra whitespace)
-                question_text = content.strip().strip('"').strip("'")
-                
-                # Validate and fix question type compliance
-                is_compliant, reason = self._validate_question_type_compliance(question_text, question_type)
-                if not is_compliant:
-                    self.logger.warning(f"Question type compliance issue: {reason}")
-                    # Try to fix the question
-                    fixed_question = self._fix_overlapping_question(question_text, question_type)
-                    if fixed_question != question_text:
-                        self.logger.info(f"Fixed question: '{question_text}' -> '{fixed_question}'")
-                        question_text = fixed_question
-                
-                # Cache the response
-                self._cache_response(cache_key, question_text)
-                
-                # Log performance metrics
-                elapsed_time = time.time() - start_time
-                self.logger.info(f"Multilingual API call completed in {elapsed_time:.2f}s")
-                
-                return question_text
+                response_data = orjson.loads(response.content)
+                return self._finalize_multilingual_question(response_data, question_type, cache_key, start_time)
             else:
                 self.logger.error(f"OpenAI API error: {response.status_code} {response.text}")
                 raise OpenAIAPIError(f"API error: {response.status_code} {response.text}")
@@ -804,6 +1419,118 @@ Return only the question text."""
             self.logger.error(f"Multilingual API request failed: {exc}")
             raise OpenAIAPIError(f"Request failed: {exc}")
 
+    def generate_multilingual_question_stream(self, question: str, response: str,
+                                              question_type: str, language: str) -> Iterator[str]:
+        """
+        Stream a multilingual follow-up question chunk by chunk.
+
+        Yields SSE content deltas as the model produces them, so callers
+        can show text before generation finishes. The assembled question
+        is cached under the same key generate_multilingual_question uses.
+
+        Args:
+            question (str): The original survey question.
+            response (str): The user's answer.
+            question_type (str): The type of follow-up question.
+            language (str): The target language.
+
+        Yields:
+            str: Incremental chunks of the generated question.
+
+        Raises:
+            OpenAIAPIError: If the API call fails.
+        """
+        cache_key = self._get_cache_key(f"{question}:{response}:{question_type}:{language}")
+        cached_response = self._get_cached_response(cache_key)
+        if cached_response:
+            yield cached_response
+            return
+
+        prompt = self._build_multilingual_prompt(question, response, question_type, language)
+        payload = dict(self._build_multilingual_payload(prompt, language))
+        payload["stream"] = True
+
+        try:
+            api_response = self.session.post(
+                self.API_URL,
+                data=orjson.dumps(payload),
+                timeout=self.TIMEOUT,
+                stream=True
+            )
+        except (RequestException, Timeout) as exc:
+            self.logger.error(f"Multilingual stream request failed: {exc}")
+            raise OpenAIAPIError(f"Request failed: {exc}")
+
+        parts = []
+        try:
+            if api_response.status_code >= 400:
+                raise OpenAIAPIError(f"HTTP {api_response.status_code}: {api_response.text[:200]}")
+
+            for line in api_response.iter_lines():
+                if not line or not line.startswith(b"data: "):
+                    continue
+                data = line[6:]
+                if data == b"[DONE]":
+                    break
+                try:
+                    delta = orjson.loads(data)["choices"][0].get("delta", {}).get("content")
+                except (orjson.JSONDecodeError, KeyError, IndexError):
+                    continue
+                if delta:
+                    parts.append(delta)
+                    yield delta
+        finally:
+            api_response.close()
+
+        # Cache the cleaned assembled question only once fully received
+        question_text = "".join(parts).strip().strip('"').strip("'")
+        if question_text:
+            self._cache_response(cache_key, question_text)
+
+    def _finalize_multilingual_question(self, response_data: Dict[str, Any], question_type: str,
+                                        cache_key: str, start_time: float) -> str:
+        """
+        Extract, clean, validate, and cache a multilingual question from an API response.
+
+        Args:
+            response_data (Dict[str, Any]): The raw chat-completion response.
+            question_type (str): The expected question type.
+            cache_key (str): The cache key to store the result under.
+            start_time (float): The request start time for performance logging.
+
+        Returns:
+            str: The cleaned question text.
+
+        Raises:
+            OpenAIAPIError: If the response contains no content.
+        """
+        # Extract the question text directly
+        content = self._extract_content(response_data)
+        if not content:
+            raise OpenAIAPIError("No content in multilingual response.")
+
+        # Clean up the response (remove quotes, extra whitespace)
+        question_text = content.strip().strip('"').strip("'")
+
+        # Validate and fix question type compliance
+        is_compliant, reason = self._validate_question_type_compliance(question_text, question_type)
+        if not is_compliant:
+            self.logger.warning(f"Question type compliance issue: {reason}")
+            # Try to fix the question
+            fixed_question = self._fix_overlapping_question(question_text, question_type)
+            if fixed_question != question_text:
+                self.logger.info(f"Fixed question: '{question_text}' -> '{fixed_question}'")
+                question_text = fixed_question
+
+        # Cache the response
+        self._cache_response(cache_key, question_text)
+
+        # Log performance metrics
+        elapsed_time = time.time() - start_time
+        self.logger.info(f"Multilingual API call completed in {elapsed_time:.2f}s")
+
+        return question_text
+
     @staticmethod
     def _build_multilingual_prompt(question: str, response: str, question_type: str, language: str) -> str:
         """
@@ -819,32 +1546,7 @@ Return only the question text."""
             str: The formatted multilingual prompt with type restrictions.
         """
         # Define strict type boundaries for multilingual generation
-        type_boundaries = {
-            "reason": {
-                "focus": "why they think/feel this way",
-                "avoid": "examples, details, effects, comparisons"
-            },
-            "impact": {
-                "focus": "effects or consequences", 
-                "avoid": "reasons, examples, details, comparisons"
-            },
-            "elaboration": {
-                "focus": "more details about their response",
-                "avoid": "examples, reasons, effects, comparisons"
-            },
-            "example": {
-                "focus": "specific examples or instances",
-                "avoid": "reasons, details, effects, comparisons"
-            },
-            "clarification": {
-                "focus": "clarify unclear terms or concepts",
-                "avoid": "examples, details, reasons, effects"
-            },
-            "comparison": {
-                "focus": "compare with alternatives",
-                "avoid": "reasons, examples, details, effects"
-            }
-        }
+        type_boundaries = _TYPE_BOUNDARIES_MULTILINGUAL
         
         boundary = type_boundaries.get(question_type.lower(), {})
         focus = boundary.get("focus", question_type)
@@ -861,6 +1563,39 @@ The question must ONLY ask for {question_type} content. Do NOT ask for examples,
 
 Return only the question text."""
 
+    @staticmethod
+    def _is_locally_noninformative(response: str, language: Optional[str] = None) -> bool:
+        """
+        Classify obviously non-informative answers without an API call.
+
+        Covers trivially short answers, exact matches against the
+        NFKC-casefolded phrase sets, packed tiny answers, and automaton
+        hits that cover most of the response. When the language is known,
+        its dedicated automaton is scanned so phrases from other languages
+        cannot misfire.
+
+        Args:
+            response (str): The user's answer.
+            language (Optional[str]): The response language, if known.
+
+        Returns:
+            bool: True when the answer is locally classifiable as non-informative.
+        """
+        normalized = unicodedata.normalize("NFKC", response.strip()).casefold()
+        if len(normalized) < _MIN_INFORMATIVE_LEN:
+            return True
+        if normalized in _NONINFORM_ALL:
+            return True
+        if len(normalized) <= 8:
+            packed = int.from_bytes(normalized.encode("utf-8").ljust(8, b" ")[:8], "little")
+            if packed in _TRIVIAL_8:
+                return True
+        automaton = _NONINFORM_AUTOMATA.get(language, _NONINFORM_AUTOMATON)
+        for _, pattern in automaton.iter(normalized):
+            if len(pattern) >= 0.8 * len(normalized):
+                return True
+        return False
+
     def detect_informativeness(self, question: str, response: str, language: str = "English") -> bool:
         """
         Detect if a response is informative enough to warrant follow-up questions.
@@ -877,50 +1612,37 @@ Return only the question text."""
         Raises:
             OpenAIAPIError: If the API call fails.
         """
+        # Local pre-filter: trivially short answers and answers that are
+        # essentially one of the known non-informative phrases don't need
+        # an API round-trip to classify
+        if self._is_locally_noninformative(response, language):
+            return False
+
         # Create cache key for informativeness detection
-        cache_key = self._get_cache_key(f"informativeness:{question}:{response}:{language}")
+        cache_key = self._get_cache_key(f"informativeness:{question}:{_normalize_for_cache(response)}:{language}")
         cached_response = self._get_cached_response(cache_key)
         if cached_response:
             return cached_response
 
         # Track performance
         start_time = time.time()
-        
+
         # Build prompt for informativeness detection
         prompt = self._build_informativeness_prompt(question, response, language)
-        
-        payload = {
-            "model": "gpt-4o-mini",
-            "messages": [
-                {
-                    "role": "system",
-                    "content": f"Analyze if the response is informative. Be GENEROUS in your assessment. If the response is relevant to the question, even if brief, consider it informative. Return ONLY '1' for informative or '0' for non-informative."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            "temperature": 0.1,  # Slightly higher temperature for more flexible classification
-            "max_tokens": 10,    # Increased tokens for better reasoning
-            "top_p": 0.9,
-            "frequency_penalty": 0.0,
-            "presence_penalty": 0.0,
-            "stream": False
-        }
+
+        payload = self._build_informativeness_payload(prompt)
 
         try:
             response = self.session.post(
                 self.API_URL,
-                headers=self._get_headers(),
-                json=payload,
+                data=orjson.dumps(payload),
                 timeout=self.TIMEOUT
             )
             if response.status_code == 200:
-                response_data = response.json()
+                response_data = orjson.loads(response.content)
                 
                 # Extract the classification result
-                content = response_data.get("choices", [{}])[0].get("message", {}).get("content", "")
+                content = self._extract_content(response_data)
                 if not content:
                     raise OpenAIAPIError("No content in informativeness response.")
                 
@@ -929,7 +1651,7 @@ Return only the question text."""
                 is_informative = result == "1"
                 
                 # Cache the result
-                self._cache_response(cache_key, is_informative)
+                self._cache_response(cache_key, is_informative, persist=True)
                 
                 # Log performance metrics
                 elapsed_time = time.time() - start_time
@@ -944,6 +1666,27 @@ Return only the question text."""
             raise OpenAIAPIError(f"Request failed: {exc}")
 
     @staticmethod
+    def _build_informativeness_payload(prompt: str) -> Dict[str, Any]:
+        """Build the chat-completion payload for informativeness detection."""
+        return {
+            "model": "gpt-4o-mini",
+            "messages": [
+                {
+                    "role": "system",
+                    "content": _SYS_INFORMATIVE
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            "temperature": 0.0,  # Deterministic one-bit classification
+            "max_tokens": 1,     # The answer is a single '0' or '1' token
+            "top_p": 0.9
+        }
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def _build_informativeness_prompt(question: str, response: str, language: str) -> str:
         """
         Build prompt for informativeness detection.
@@ -957,95 +1700,146 @@ Return only the question text."""
         Returns:
             str: The formatted informativeness detection prompt.
         """
-        # Define non-informative patterns in multiple languages (comprehensive list)
-        non_informative_patterns = {
-            "English": [
-                "i don't know", "idk", "dunno", "n/a", "none", "nothing", "no idea", "not applicable", "skip", "pass",
-                "i don't care", "whatever", "no comment", "no response", "blank", "empty", "no answer",
-                "not sure", "maybe", "possibly", "perhaps", "no preference", "no opinion", "neutral",
-                "don't have one", "haven't thought about it", "no thoughts", "no input", "no feedback",
-                "no experience", "never used", "not familiar", "don't use", "not applicable to me",
-                "doesn't apply", "not relevant", "no interest", "don't care", "indifferent"
-            ],
-            "Chinese": [
-                "我不知道", "不知道", "不晓得", "没有", "无", "跳过", "不适用", "无所谓", "没意见",
-                "不确定", "可能", "也许", "没想法", "没经验", "没用过", "不熟悉", "不关心",
-                "没兴趣", "不相关", "不适用", "没回答", "空白", "没反馈", "没想法"
-            ],
-            "Japanese": [
-                "わかりません", "知りません", "不明", "なし", "無し", "スキップ", "該当なし", "どうでもいい",
-                "意見なし", "わからない", "たぶん", "もしかして", "考えなし", "経験なし", "使ったことない",
-                "不慣れ", "興味なし", "関係ない", "適用外", "回答なし", "空白", "フィードバックなし"
-            ],
-            "Spanish": [
-                "no sé", "no lo sé", "ninguno", "nada", "no idea", "saltar", "no aplica", "no me importa",
-                "no tengo opinión", "no estoy seguro", "tal vez", "quizás", "no tengo preferencia",
-                "no tengo experiencia", "no he usado", "no estoy familiarizado", "no me interesa",
-                "no es relevante", "no aplica a mí", "no tengo comentarios", "en blanco", "sin respuesta"
-            ],
-            "French": [
-                "je ne sais pas", "aucun", "rien", "passer", "ne s'applique pas", "je m'en fiche",
-                "pas d'avis", "pas sûr", "peut-être", "pas de préférence", "pas d'expérience",
-                "jamais utilisé", "pas familier", "pas intéressé", "pas pertinent", "pas applicable",
-                "pas de commentaire", "vide", "sans réponse", "indifférent", "neutre"
-            ],
-            "German": [
-                "ich weiß nicht", "weiß nicht", "keiner", "nichts", "überspringen", "nicht zutreffend",
-                "ist mir egal", "keine Meinung", "nicht sicher", "vielleicht", "keine Präferenz",
-                "keine Erfahrung", "nie benutzt", "nicht vertraut", "nicht interessiert",
-                "nicht relevant", "nicht anwendbar", "kein Kommentar", "leer", "keine Antwort",
-                "gleichgültig", "neutral"
-            ],
-            "Korean": [
-                "모르겠어요", "모름", "없음", "아무것도", "건너뛰기", "해당없음", "상관없어요", "의견없음",
-                "확실하지 않아요", "아마도", "어쩌면", "선호도 없음", "경험 없음", "사용해본 적 없음",
-                "익숙하지 않음", "관심 없음", "관련 없음", "해당 안됨", "댓글 없음", "빈칸", "답변 없음",
-                "무관심", "중립"
-            ]
-        }
-        
-        # Get patterns for the specific language, default to English
-        patterns = non_informative_patterns.get(language, non_informative_patterns["English"])
-        patterns_str = ", ".join(patterns)
-        
+        # Dynamic tail only: the assessment guidelines live in the static
+        # system prompt (_SYS_INFORMATIVE) so the cacheable prefix is
+        # identical across calls
         return f"""Question: {question}
 Response: {response}
 
-Is this response informative enough to ask follow-up questions?
+Return '1' for informative or '0' for non-informative."""
+
+    def detect_informativeness_batch(self, question: str, responses: list, language: str = "English") -> list:
+        """
+        Classify several responses to one question in a single API call.
 
-IMPORTANT GUIDELINES:
-- Be GENEROUS in your assessment
-- Focus on RELEVANCE to the question, not length
-- If the response is related to the question topic, consider it informative
-- Even brief responses can be informative if they address the question
-- Only classify as non-informative if the response shows no engagement with the question
-
-Non-informative responses are ONLY: {patterns_str}
-
-Examples of INFORMATIVE responses (even if brief):
-- "Using Business Liability" (addresses business credit preference)
-- "Cost savings" (mentions a reason)
-- "Better tracking" (provides a benefit)
-- "Tax benefits" (gives a specific advantage)
-- "Convenience" (provides a benefit)
-- "Security" (mentions a concern)
-- "Speed" (mentions a preference)
-- "Reliability" (mentions a quality)
-
-Examples of NON-INFORMATIVE responses:
-- "I don't know"
-- "N/A"
-- "Skip"
-- "No idea"
-- "Whatever"
-- "No comment"
-- "Not sure"
-- "Maybe"
-- "No preference"
-- "Don't care"
-- "Indifferent"
+        Locally classifiable and cached items never reach the network;
+        the remainder share one numbered prompt, amortizing the HTTP
+        round-trip and time-to-first-token over the batch.
 
-Return '1' for informative or '0' for non-informative."""
+        Args:
+            question (str): The original survey question.
+            responses (list): The users' answers.
+            language (str): The language of the question and responses.
+
+        Returns:
+            list: Per-response booleans, in input order.
+        """
+        results: List[Optional[bool]] = [None] * len(responses)
+        pending = []  # (index, response, cache_key)
+
+        for idx, response in enumerate(responses):
+            if self._is_locally_noninformative(response, language):
+                results[idx] = False
+                continue
+            cache_key = self._get_cache_key(f"informativeness:{question}:{_normalize_for_cache(response)}:{language}")
+            cached = self._get_cached_response(cache_key)
+            if cached is not None:
+                results[idx] = cached
+                continue
+            pending.append((idx, response, cache_key))
+
+        if not pending:
+            return results
+
+        items_str = "\n".join(f'{n}) "{response}"' for n, (_, response, _) in enumerate(pending, start=1))
+        prompt = f"""Question: {question}
+
+Responses:
+{items_str}
+
+Return ONLY a JSON array with one object per response, like:
+[{{"id": 1, "informative": 0 or 1}}]"""
+
+        payload = {
+            "model": "gpt-4o-mini",
+            "messages": [
+                {"role": "system", "content": _SYS_INFORMATIVE},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": 0.0,
+            "max_tokens": 15 * len(pending)
+        }
+
+        try:
+            api_response = self.session.post(
+                self.API_URL,
+                data=orjson.dumps(payload),
+                timeout=self.TIMEOUT
+            )
+            if api_response.status_code >= 400:
+                raise OpenAIAPIError(f"HTTP {api_response.status_code}: {api_response.text[:200]}")
+            content = self._extract_content(orjson.loads(api_response.content)).strip()
+            json_match = _JSON_ARR_RE.search(content)
+            if not json_match:
+                raise ValueError(f"No JSON array in batched informativeness response: {content}")
+            by_id = {
+                int(entry["id"]): bool(entry.get("informative"))
+                for entry in orjson.loads(json_match.group(0))
+                if isinstance(entry, dict) and "id" in entry
+            }
+            for n, (idx, _, cache_key) in enumerate(pending, start=1):
+                if n in by_id:
+                    results[idx] = by_id[n]
+                    self._cache_response(cache_key, by_id[n], persist=True)
+        except Exception as e:
+            self.logger.warning(f"Batched informativeness detection failed, falling back per item: {e}")
+
+        # Per-item fallback for anything the batch call didn't resolve
+        for idx, response, _ in pending:
+            if results[idx] is None:
+                results[idx] = self.detect_informativeness(question, response, language)
+        return results
+
+    def detect_themes_in_response_batch(self, responses: list, themes: list) -> list:
+        """
+        Detect themes for several responses in one API call.
+
+        Cached and locally matched responses are resolved first; the
+        remainder go through the existing batched detection request.
+
+        Args:
+            responses (list): The users' answers.
+            themes (list): List of theme dictionaries with 'name' and 'importance' keys.
+
+        Returns:
+            list: Per-response Optional[ThemeResult], in input order.
+        """
+        results: List[Optional[ThemeResult]] = [None] * len(responses)
+        resolved = [False] * len(responses)
+        pending = []  # (index, cache_key)
+
+        for idx, response in enumerate(responses):
+            cache_key = self._get_cache_key(f"theme_detection:{_normalize_for_cache(response)}:{self._themes_key(themes)}")
+            cached = self._get_cached_response(cache_key)
+            if cached is not None:
+                results[idx] = cached
+                resolved[idx] = True
+                continue
+            local_match = self._local_theme_match(response, themes)
+            if local_match:
+                self._cache_response(cache_key, local_match, persist=True)
+                results[idx] = local_match
+                resolved[idx] = True
+                continue
+            pending.append((idx, cache_key))
+
+        if not pending:
+            return results
+
+        try:
+            batch_results = self._detect_themes_batch_api(
+                [(responses[idx], themes) for idx, _ in pending]
+            )
+            for (idx, cache_key), detected in zip(pending, batch_results):
+                results[idx] = detected
+                resolved[idx] = True
+                self._cache_response(cache_key, detected, persist=True)
+        except Exception as e:
+            self.logger.warning(f"Batched theme detection failed, falling back per item: {e}")
+            for idx, _ in pending:
+                if not resolved[idx]:
+                    results[idx] = self.detect_themes_in_response(responses[idx], themes)
+        return results
 
     def generate_enhanced_multilingual_question(self, question: str, response: str, question_type: str, language: str) -> dict:
         """
@@ -1085,187 +1879,406 @@ Return '1' for informative or '0' for non-informative."""
             self.logger.error(f"Failed to generate question for informative response: {e}")
             raise e
 
-    def detect_themes_in_response(self, response: str, themes: list) -> Optional[dict]:
+    def detect_informativeness_and_theme(self, question: str, response: str, themes: list,
+                                         language: str = "English") -> tuple:
         """
-        Detect which themes from the provided list are present in the response.
+        Run informativeness detection and theme detection in one API call.
+
+        Both signals share the same response context, so fusing them halves
+        the round-trips and output tokens for the theme-enhanced path.
 
         Args:
+            question (str): The original survey question.
             response (str): The user's response to analyze.
             themes (list): List of theme dictionaries with 'name' and 'importance' keys.
+            language (str): The language of the question and response.
 
         Returns:
-            Optional[dict]: Dictionary with detected theme info or None if no themes found.
+            tuple: (is_informative (bool), detected_theme (Optional[dict])).
         """
-        cache_key = self._get_cache_key(f"theme_detection:{response}:{str(themes)}")
+        # Empty or trivially non-informative answers short-circuit both
+        # signals before any cache or network work
+        if self._is_locally_noninformative(response, language):
+            return False, None
+
+        cache_key = self._get_cache_key(f"informative_theme:{question}:{_normalize_for_cache(response)}:{language}:{self._themes_key(themes)}")
         cached_result = self._get_cached_response(cache_key)
         if cached_result:
             return cached_result
 
-        try:
-            prompt = self._build_theme_detection_prompt(response, themes)
-            
-            payload = {
-                "model": "gpt-4o-mini",
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": "Analyze the response for theme matches. Return ONLY a JSON object with 'theme_name' and 'importance' or 'none' if no themes found."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                "temperature": 0.0,  # Zero temperature for fastest, most consistent theme detection
-                "max_tokens": 30,    # Reduced for faster JSON response
-                "top_p": 0.8,
-                "frequency_penalty": 0.0,
-                "presence_penalty": 0.0,
-                "stream": False
-            }
+        themes_str = _themes_prompt_str(tuple((t["name"], t["importance"]) for t in themes))
+        prompt = f"""Question: {question}
+Response: {response}
+
+Available themes: {themes_str}"""
+
+        payload = {
+            "model": "gpt-4o-mini",
+            "messages": [
+                {
+                    "role": "system",
+                    "content": _SYS_INFORMATIVE_THEME
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            "response_format": {"type": "json_object"},
+            "temperature": 0.0,
+            "max_tokens": 50
+        }
 
-            response_data = self.session.post(
+        try:
+            start_time = time.time()
+            api_response = self.session.post(
                 self.API_URL,
-                headers=self._get_headers(),
-                json=payload,
+                data=orjson.dumps(payload),
                 timeout=self.TIMEOUT
             )
-            response_data.raise_for_status()
-            
-            result = response_data.json()
-            content = result["choices"][0]["message"]["content"].strip()
-            
-            # Parse the JSON response
-            import json
-            import re
-            
-            # Clean the content - remove any extra text before or after JSON
-            content_clean = content.strip()
-            
-            # Try to extract JSON from the response
-            json_match = re.search(r'\{.*\}', content_clean)
-            if json_match:
-                content_clean = json_match.group(0)
-            
-            try:
-                theme_result = json.loads(content_clean)
-                if theme_result.get("theme_name") == "none":
-                    result_data = None
-                else:
-                    result_data = {
-                        "theme_name": theme_result.get("theme_name"),
-                        "importance": theme_result.get("importance")
-                    }
-            except json.JSONDecodeError:
-                self.logger.warning(f"Failed to parse theme detection response as JSON: {content}")
-                # Fallback: try flexible string matching
-                result_data = None
-                response_lower = response.lower()
-                
-                # Try exact matches first
-                for theme in themes:
-                    theme_name_lower = theme["name"].lower()
-                    if theme_name_lower in response_lower:
-                        result_data = {
-                            "theme_name": theme["name"],
-                            "importance": theme["importance"]
-                        }
-                        break
-                
-                # If no exact match, try partial word matches
-                if not result_data:
-                    for theme in themes:
-                        theme_words = theme["name"].lower().split()
-                        for word in theme_words:
-                            if len(word) > 3 and word in response_lower:  # Only match words longer than 3 chars
-                                result_data = {
-                                    "theme_name": theme["name"],
-                                    "importance": theme["importance"]
-                                }
-                                break
-                        if result_data:
-                            break
-                
-                # If still no match, try semantic word matching
-                if not result_data:
-                    semantic_mappings = {
-                        "collaboration": ["together", "teamwork", "cooperate", "joint", "shared"],
-                        "communication": ["talk", "speak", "discuss", "conversation", "meeting", "email"],
-                        "leadership": ["manage", "lead", "guide", "direct", "supervise", "oversee"],
-                        "teamwork": ["collaborate", "together", "group", "team", "coordinate"],
-                        "innovation": ["creative", "new", "improve", "develop", "design", "invent"]
-                    }
-                    
-                    for theme in themes:
-                        theme_name = theme["name"].lower()
-                        if theme_name in semantic_mappings:
-                            for semantic_word in semantic_mappings[theme_name]:
-                                if semantic_word in response_lower:
-                                    result_data = {
-                                        "theme_name": theme["name"],
-                                        "importance": theme["importance"]
-                                    }
-                                    break
-                        if result_data:
-                            break
-            
-            self._cache_response(cache_key, result_data)
+            if api_response.status_code >= 400:
+                raise OpenAIAPIError(f"HTTP {api_response.status_code}: {api_response.text[:200]}")
+
+            content = self._extract_content(orjson.loads(api_response.content)).strip()
+
+            json_match = _JSON_OBJ_RE.search(content)
+            if not json_match:
+                raise ValueError(f"No JSON object in fused detection response: {content}")
+            parsed = orjson.loads(json_match.group(0))
+
+            is_informative = bool(parsed.get("informative"))
+            theme_name = parsed.get("theme_name")
+            if theme_name and theme_name != "none":
+                detected_theme = ThemeResult(
+                    theme_name=theme_name,
+                    importance=parsed.get("importance")
+                )
+            else:
+                detected_theme = None
+
+            result = (is_informative, detected_theme)
+            self._cache_response(cache_key, result, persist=True)
+
+            elapsed_time = time.time() - start_time
+            self.logger.info(f"Fused informativeness+theme detection completed in {elapsed_time:.2f}s")
+            return result
+        except Exception as e:
+            # Fall back to the two legacy calls if the fused call misbehaves
+            self.logger.warning(f"Fused detection failed, falling back to separate calls: {e}")
+            is_informative = self.detect_informativeness(question, response, language)
+            detected_theme = self.detect_themes_in_response(response, themes)
+            return is_informative, detected_theme
+
+    def detect_themes_in_response(self, response: str, themes: list) -> Optional[ThemeResult]:
+        """
+        Detect which themes from the provided list are present in the response.
+
+        Cache misses go through a micro-batcher that coalesces concurrent
+        calls into one API request, amortizing HTTP and rate-limit cost
+        across callers.
+
+        Args:
+            response (str): The user's response to analyze.
+            themes (list): List of theme dictionaries with 'name' and 'importance' keys.
+
+        Returns:
+            Optional[ThemeResult]: Detected theme info or None if no themes found.
+        """
+        cache_key = self._get_cache_key(f"theme_detection:{_normalize_for_cache(response)}:{self._themes_key(themes)}")
+        cached_result = self._get_cached_response(cache_key)
+        if cached_result:
+            return cached_result
+
+        # Fast path: if a theme name or a known synonym appears in the
+        # response, the automaton answers in O(len(response)) with no API
+        # round-trip
+        local_match = self._local_theme_match(response, themes)
+        if local_match:
+            self._cache_response(cache_key, local_match, persist=True)
+            return local_match
+
+        try:
+            result_data = self._singleflight(
+                cache_key,
+                lambda: self._get_theme_batcher().submit(response, themes).result(timeout=self.TIMEOUT * 2)
+            )
+            self._cache_response(cache_key, result_data, persist=True)
             return result_data
-            
         except Exception as e:
             self.logger.error(f"Theme detection failed: {e}")
             return None
 
     @staticmethod
-    def _build_theme_detection_prompt(response: str, themes: list) -> str:
+    def _local_theme_match(response: str, themes: list) -> Optional[ThemeResult]:
         """
-        Build prompt for theme detection with flexible matching.
+        Find a theme whose name or known synonym occurs in the response.
+
+        When several themes match, the highest-importance one wins,
+        mirroring the tiebreak rule in the detection prompt.
 
         Args:
             response (str): The user's response to analyze.
-            themes (list): List of theme dictionaries.
+            themes (list): List of theme dictionaries with 'name' and 'importance' keys.
 
         Returns:
-            str: The formatted prompt for theme detection.
+            Optional[ThemeResult]: Detected theme info or None if no local match.
         """
-        themes_str = ", ".join([f"'{t['name']}' (importance: {t['importance']}%)" for t in themes])
-        
-        return f"""Analyze this response for theme matches with FLEXIBLE matching:
+        automaton = _theme_automaton(tuple((t["name"], t["importance"]) for t in themes))
+        hits = [hit for _, hit in automaton.iter(response.lower())]
+        if not hits:
+            return None
+        return max(hits, key=lambda h: h.importance)
 
-Response: "{response}"
+    def _get_theme_batcher(self) -> "_ThemeBatcher":
+        """Lazily create the shared theme-detection batcher."""
+        if getattr(self, "_theme_batcher", None) is None:
+            self._theme_batcher = _ThemeBatcher(self)
+        return self._theme_batcher
 
-Available themes: {themes_str}
+    def _detect_themes_api(self, response: str, themes: list) -> Optional[ThemeResult]:
+        """
+        Issue a single theme-detection API call for one response.
 
-Look for:
-1. EXACT matches: "communication" matches "communication"
-2. PARTIAL matches: "team communication" matches "communication" 
-3. RELATED concepts: "talking to colleagues" matches "communication"
-4. SYNONYMS: "leading the team" matches "leadership"
-5. SEMANTIC similarity: "managing people" matches "leadership"
-6. CONTEXTUAL relevance: "email and meetings" matches "communication"
-7. SEMANTIC WORDS: "work together" matches "collaboration", "teamwork" matches "collaboration"
+        Args:
+            response (str): The user's response to analyze.
+            themes (list): List of theme dictionaries with 'name' and 'importance' keys.
 
-Be VERY GENEROUS in matching - if the response is even slightly related to a theme, consider it a match.
-Look for semantic relationships, not just exact words.
+        Returns:
+            Optional[ThemeResult]: Detected theme info or None if no themes found.
+        """
+        try:
+            prompt = self._build_theme_detection_prompt(
+                response, tuple((t["name"], t["importance"]) for t in themes))
 
-Return ONLY a JSON object like this:
-{{"theme_name": "theme_name", "importance": importance_number}}
+            payload = self._build_theme_detection_payload(prompt)
 
-If no themes are found, return:
-{{"theme_name": "none", "importance": 0}}
+            payload["stream"] = True
 
-Examples:
-- Response: "I use email and Slack" → matches "communication" (partial match)
-- Response: "I manage a team" → matches "leadership" (semantic match)  
-- Response: "We work together" → matches "collaboration" (semantic words)
-- Response: "I talk to my boss" → matches "communication" (contextual)
-- Response: "We share information" → matches "collaboration" (semantic)
+            content = self._stream_json_content(payload)
 
-Choose the theme with the highest importance if multiple themes are found."""
+            return self._parse_theme_detection_content(content, response, themes)
 
-    def generate_theme_enhanced_question(self, question: str, response: str, question_type: str, language: str, 
-                                       theme: str, theme_parameters: Optional[dict] = None) -> dict:
-        """
+        except Exception as e:
+            self.logger.error(f"Theme detection failed: {e}")
+            raise
+
+    def _stream_json_content(self, payload: Dict[str, Any]) -> str:
+        """
+        Stream a chat completion and stop once its JSON object closes.
+
+        Accumulates SSE content deltas while tracking brace depth; when a
+        balanced {...} has arrived the connection is closed without
+        waiting for the remaining tokens or stream teardown.
+
+        Args:
+            payload (Dict[str, Any]): Chat-completion payload with "stream": True.
+
+        Returns:
+            str: The accumulated message content.
+        """
+        response_data = self.session.post(
+            self.API_URL,
+            data=orjson.dumps(payload),
+            timeout=self.TIMEOUT,
+            stream=True
+        )
+        try:
+            if response_data.status_code >= 400:
+                raise OpenAIAPIError(f"HTTP {response_data.status_code}: {response_data.text[:200]}")
+
+            buffer = []
+            depth = 0
+            seen_brace = False
+            for line in response_data.iter_lines():
+                if not line or not line.startswith(b"data: "):
+                    continue
+                data = line[6:]
+                if data == b"[DONE]":
+                    break
+                try:
+                    delta = orjson.loads(data)["choices"][0].get("delta", {}).get("content")
+                except (orjson.JSONDecodeError, KeyError, IndexError):
+                    continue
+                if not delta:
+                    continue
+                buffer.append(delta)
+                for char in delta:
+                    if char == '{':
+                        depth += 1
+                        seen_brace = True
+                    elif char == '}':
+                        depth -= 1
+                # Balanced object received - no need to wait for the rest
+                if seen_brace and depth <= 0:
+                    break
+            return "".join(buffer).strip()
+        finally:
+            response_data.close()
+
+    @staticmethod
+    def _build_theme_detection_payload(prompt: str) -> Dict[str, Any]:
+        """Build the chat-completion payload for theme detection."""
+        return {
+            "model": "gpt-4o-mini",
+            "messages": [
+                {
+                    "role": "system",
+                    "content": _SYS_THEME_DETECT
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            # Constrained JSON output keeps the parser on the fast path
+            # instead of the regex/fuzzy fallback cascade
+            "response_format": {"type": "json_object"},
+            "temperature": 0.0,  # Zero temperature for fastest, most consistent theme detection
+            "max_tokens": 25,    # A theme object never needs more
+            "top_p": 0.8
+        }
+
+    def _parse_theme_detection_content(self, content: str, response: str, themes: list) -> Optional[ThemeResult]:
+        """
+        Parse a theme-detection response, falling back to string matching.
+
+        Args:
+            content (str): The model's response content.
+            response (str): The user's response being analyzed.
+            themes (list): List of theme dictionaries.
+
+        Returns:
+            Optional[ThemeResult]: Detected theme info or None if no themes found.
+        """
+        # Clean the content - remove any extra text before or after JSON
+        content_clean = content.strip()
+
+        # Try to extract JSON from the response
+        json_match = _JSON_OBJ_RE.search(content_clean)
+        if json_match:
+            content_clean = json_match.group(0)
+
+        try:
+            theme_result = orjson.loads(content_clean)
+            if theme_result.get("theme_name") == "none":
+                result_data = None
+            else:
+                result_data = ThemeResult(
+                    theme_name=theme_result.get("theme_name"),
+                    importance=theme_result.get("importance")
+                )
+        except orjson.JSONDecodeError:
+            self.logger.warning(f"Failed to parse theme detection response as JSON: {content}")
+            # Fallback: one pass of the precompiled alternation regex,
+            # keeping the exact > partial > semantic priority via tiers
+            result_data = None
+            pattern, groups = _theme_fallback_regex(tuple((t["name"], t["importance"]) for t in themes))
+            best_tier = None
+            for match in pattern.finditer(response):
+                tier, candidate = groups[match.lastgroup]
+                if best_tier is None or tier < best_tier:
+                    best_tier, result_data = tier, candidate
+                    if tier == 0:
+                        break
+
+        return result_data
+
+    def _detect_themes_batch_api(self, items: list) -> list:
+        """
+        Detect themes for several responses in a single API call.
+
+        Args:
+            items (list): List of (response, themes) tuples.
+
+        Returns:
+            list: Per-item results (dict with theme info or None), in input order.
+        """
+        lines = []
+        for idx, (response, themes) in enumerate(items, start=1):
+            themes_str = ", ".join([f"'{t['name']}' (importance: {t['importance']}%)" for t in themes])
+            lines.append(f'Item {idx}:\nResponse: "{response}"\nAvailable themes: {themes_str}')
+        items_str = "\n\n".join(lines)
+
+        prompt = f"""For each numbered item below, decide which theme (if any) the response matches.
+Be VERY GENEROUS in matching - exact, partial, and semantic matches all count.
+Choose the theme with the highest importance if multiple themes match.
+
+{items_str}
+
+Return ONLY a JSON array with one object per item, like:
+[{{"id": 1, "theme_name": "theme_name or none", "importance": importance_number}}]"""
+
+        payload = {
+            "model": "gpt-4o-mini",
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "Analyze each response for theme matches. Return ONLY a JSON array of objects with 'id', 'theme_name', and 'importance' fields."
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            "temperature": 0.0,
+            "max_tokens": 30 * len(items)
+        }
+
+        api_response = self.session.post(
+            self.API_URL,
+            data=orjson.dumps(payload),
+            timeout=self.TIMEOUT
+        )
+        if api_response.status_code >= 400:
+            raise OpenAIAPIError(f"HTTP {api_response.status_code}: {api_response.text[:200]}")
+        content = self._extract_content(orjson.loads(api_response.content)).strip()
+
+        json_match = _JSON_ARR_RE.search(content)
+        if not json_match:
+            raise ValueError(f"No JSON array in batched theme response: {content}")
+        parsed = orjson.loads(json_match.group(0))
+
+        by_id = {}
+        for entry in parsed:
+            if isinstance(entry, dict) and "id" in entry:
+                by_id[int(entry["id"])] = entry
+
+        results = []
+        for idx in range(1, len(items) + 1):
+            entry = by_id.get(idx)
+            if entry and entry.get("theme_name") and entry["theme_name"] != "none":
+                results.append(ThemeResult(
+                    theme_name=entry["theme_name"],
+                    importance=entry.get("importance")
+                ))
+            else:
+                results.append(None)
+        return results
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _build_theme_detection_prompt(response: str, theme_items: tuple) -> str:
+        """
+        Build prompt for theme detection with flexible matching.
+
+        Memoized: batch scoring reuses one theme list across many
+        responses, and repeated responses skip the rebuild entirely.
+
+        Args:
+            response (str): The user's response to analyze.
+            theme_items (tuple): Hashable ((name, importance), ...) theme tuple.
+
+        Returns:
+            str: The formatted prompt for theme detection.
+        """
+        themes_str = _themes_prompt_str(theme_items)
+        # Only the dynamic tail: the matching rules live in the static
+        # system prompt so the cacheable prefix is identical across calls
+        return f'Response: "{response}"\n\nAvailable themes: {themes_str}'
+
+    def generate_theme_enhanced_question(self, question: str, response: str, question_type: str, language: str, 
+                                       theme: str, theme_parameters: Optional[dict] = None) -> dict:
+        """
         Generate a theme-enhanced multilingual follow-up question with optimized performance.
 
         Args:
@@ -1303,23 +2316,12 @@ Choose the theme with the highest importance if multiple themes are found."""
             raise ValueError("Theme parameters required when theme='Yes'")
 
         themes = [{"name": t["name"], "importance": t["importance"]} for t in theme_parameters["themes"]]
-        
-        # OPTIMIZATION: Run informativeness detection and theme detection in parallel
-        start_time = time.time()
-        
-        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
-            # Submit both tasks simultaneously
-            informativeness_future = executor.submit(self.detect_informativeness, question, response, language)
-            theme_detection_future = executor.submit(self.detect_themes_in_response, response, themes)
-            
-            # Wait for both results
-            is_informative = informativeness_future.result()
-            detected_theme = theme_detection_future.result()
-        
-        # Log performance improvement
-        elapsed_time = time.time() - start_time
-        self.logger.info(f"Parallel processing completed in {elapsed_time:.2f}s")
-        
+
+        # OPTIMIZATION: One fused API call answers both questions
+        is_informative, detected_theme = self.detect_informativeness_and_theme(
+            question, response, themes, language
+        )
+
         # OPTIMIZATION: Early return for non-informative responses
         if not is_informative:
             return {
@@ -1336,15 +2338,15 @@ Choose the theme with the highest importance if multiple themes are found."""
             try:
                 result = self._generate_theme_based_question(
                     question, response, question_type, language, 
-                    detected_theme["theme_name"], detected_theme["importance"]
+                    detected_theme.theme_name, detected_theme.importance
                 )
                 return {
                     "informative": 1,
-                    "question": result["question"],
-                    "explanation": result["explanation"],
+                    "question": result.question,
+                    "explanation": result.explanation,
                     "theme": theme,
-                    "detected_theme": detected_theme["theme_name"],
-                    "theme_importance": detected_theme["importance"],
+                    "detected_theme": detected_theme.theme_name,
+                    "theme_importance": detected_theme.importance,
                     "highest_importance_theme": None
                 }
             except OpenAIAPIError as e:
@@ -1361,8 +2363,8 @@ Choose the theme with the highest importance if multiple themes are found."""
                 )
                 return {
                     "informative": 1,
-                    "question": result["question"],
-                    "explanation": result["explanation"],
+                    "question": result.question,
+                    "explanation": result.explanation,
                     "theme": theme,
                     "detected_theme": None,
                     "theme_importance": None,
@@ -1372,7 +2374,38 @@ Choose the theme with the highest importance if multiple themes are found."""
                 self.logger.error(f"Failed to generate missing theme question: {e}")
                 raise e
 
-    def generate_theme_enhanced_optional_question(self, question: str, response: str, question_type: str, language: str, 
+    def generate_theme_enhanced_batch(self, items: List[dict]) -> List[tuple]:
+        """
+        Generate theme-enhanced questions for many requests concurrently.
+
+        Each item runs through the same pipeline as the single endpoint
+        (cache, local pre-filters, fused detection), fanned out on the
+        shared executor. A semaphore caps in-flight items so one large
+        batch cannot monopolize the connection pool; per-item failures
+        are returned in place instead of failing the whole batch.
+
+        Args:
+            items (List[dict]): Keyword dicts for generate_theme_enhanced_question.
+
+        Returns:
+            List[tuple]: Per item, ("ok", result_dict) or ("error", message).
+        """
+        limit = threading.Semaphore(int(os.getenv("OPENAI_BATCH_CONCURRENCY", "8")))
+
+        def run_one(item: dict) -> dict:
+            with limit:
+                return self.generate_theme_enhanced_question(**item)
+
+        futures = [_PARALLEL_EXECUTOR.submit(run_one, item) for item in items]
+        results = []
+        for future in futures:
+            try:
+                results.append(("ok", future.result(timeout=self.TIMEOUT * 4)))
+            except Exception as exc:
+                results.append(("error", str(exc)))
+        return results
+
+    def generate_theme_enhanced_optional_question(self, question: str, response: str, question_type: str, language: str,
                                                 theme: str, check_informative: bool, theme_parameters: Optional[dict] = None) -> dict:
         """
         Generate a theme-enhanced multilingual follow-up question with optional informative detection.
@@ -1434,24 +2467,53 @@ Choose the theme with the highest importance if multiple themes are found."""
         
         # If informative detection is disabled, skip it
         if not check_informative:
+            # Optionally start generating for the most important theme
+            # while detection runs; if detection agrees, one model RTT is
+            # hidden, otherwise the speculative result is discarded
+            speculative_future = None
+            speculated_theme = None
+            if _SPECULATIVE_THEME_GEN:
+                speculated_theme = max(themes, key=lambda x: x["importance"])
+                speculative_future = _PARALLEL_EXECUTOR.submit(
+                    self._generate_theme_based_question,
+                    question, response, question_type, language,
+                    speculated_theme["name"], speculated_theme["importance"]
+                )
+
             # Run theme detection only
             detected_theme = self.detect_themes_in_response(response, themes)
-            
+
+            if speculative_future is not None:
+                if (detected_theme
+                        and detected_theme.theme_name == speculated_theme["name"]):
+                    result = speculative_future.result()
+                    return {
+                        "informative": None,
+                        "question": result.question,
+                        "explanation": result.explanation,
+                        "theme": theme,
+                        "check_informative": check_informative,
+                        "detected_theme": detected_theme.theme_name,
+                        "theme_importance": detected_theme.importance,
+                        "highest_importance_theme": None
+                    }
+                speculative_future.cancel()
+
             if detected_theme:
                 # Theme found - generate question based on detected theme and type
                 try:
                     result = self._generate_theme_based_question(
                         question, response, question_type, language, 
-                        detected_theme["theme_name"], detected_theme["importance"]
+                        detected_theme.theme_name, detected_theme.importance
                     )
                     return {
                         "informative": None,
-                        "question": result["question"],
-                        "explanation": result["explanation"],
+                        "question": result.question,
+                        "explanation": result.explanation,
                         "theme": theme,
                         "check_informative": check_informative,
-                        "detected_theme": detected_theme["theme_name"],
-                        "theme_importance": detected_theme["importance"],
+                        "detected_theme": detected_theme.theme_name,
+                        "theme_importance": detected_theme.importance,
                         "highest_importance_theme": None
                     }
                 except OpenAIAPIError as e:
@@ -1468,8 +2530,8 @@ Choose the theme with the highest importance if multiple themes are found."""
                     )
                     return {
                         "informative": None,
-                        "question": result["question"],
-                        "explanation": result["explanation"],
+                        "question": result.question,
+                        "explanation": result.explanation,
                         "theme": theme,
                         "check_informative": check_informative,
                         "detected_theme": None,
@@ -1480,22 +2542,18 @@ Choose the theme with the highest importance if multiple themes are found."""
                     self.logger.error(f"Failed to generate missing theme question: {e}")
                     raise e
         
-        # If informative detection is enabled, use the original logic
+        # If informative detection is enabled, fuse both classifications
+        # into one API round-trip instead of two parallel ones
         start_time = time.time()
-        
-        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
-            # Submit both tasks simultaneously
-            informativeness_future = executor.submit(self.detect_informativeness, question, response, language)
-            theme_detection_future = executor.submit(self.detect_themes_in_response, response, themes)
-            
-            # Wait for both results
-            is_informative = informativeness_future.result()
-            detected_theme = theme_detection_future.result()
-        
+
+        is_informative, detected_theme = self.detect_informativeness_and_theme(
+            question, response, themes, language
+        )
+
         # Log performance improvement
         elapsed_time = time.time() - start_time
-        self.logger.info(f"Parallel processing completed in {elapsed_time:.2f}s")
-        
+        self.logger.info(f"Fused informativeness+theme detection completed in {elapsed_time:.2f}s")
+
         # Early return for non-informative responses
         if not is_informative:
             return {
@@ -1514,16 +2572,16 @@ Choose the theme with the highest importance if multiple themes are found."""
             try:
                 result = self._generate_theme_based_question(
                     question, response, question_type, language, 
-                    detected_theme["theme_name"], detected_theme["importance"]
+                    detected_theme.theme_name, detected_theme.importance
                 )
                 return {
                     "informative": 1,
-                    "question": result["question"],
-                    "explanation": result["explanation"],
+                    "question": result.question,
+                    "explanation": result.explanation,
                     "theme": theme,
                     "check_informative": check_informative,
-                    "detected_theme": detected_theme["theme_name"],
-                    "theme_importance": detected_theme["importance"],
+                    "detected_theme": detected_theme.theme_name,
+                    "theme_importance": detected_theme.importance,
                     "highest_importance_theme": None
                 }
             except OpenAIAPIError as e:
@@ -1540,8 +2598,8 @@ Choose the theme with the highest importance if multiple themes are found."""
                 )
                 return {
                     "informative": 1,
-                    "question": result["question"],
-                    "explanation": result["explanation"],
+                    "question": result.question,
+                    "explanation": result.explanation,
                     "theme": theme,
                     "check_informative": check_informative,
                     "detected_theme": None,
@@ -1553,7 +2611,7 @@ Choose the theme with the highest importance if multiple themes are found."""
                 raise e
 
     def _generate_theme_based_question(self, question: str, response: str, question_type: str, 
-                                     language: str, theme_name: str, theme_importance: int) -> dict:
+                                     language: str, theme_name: str, theme_importance: int) -> QEResult:
         """
         Generate a question based on detected theme and question type.
 
@@ -1566,64 +2624,66 @@ Choose the theme with the highest importance if multiple themes are found."""
             theme_importance (int): The importance percentage of the theme.
 
         Returns:
-            dict: Dictionary containing question and explanation.
+            QEResult: The generated question and its explanation.
         """
-        cache_key = self._get_cache_key(f"theme_question:{question}:{response}:{question_type}:{language}:{theme_name}")
+        cache_key = self._get_cache_key(f"theme_question:{question}:{_normalize_for_cache(response)}:{question_type}:{language}:{theme_name}")
         cached_result = self._get_cached_response(cache_key)
         if cached_result:
             return cached_result
 
+        result_data = self._singleflight(
+            cache_key,
+            lambda: self._generate_theme_based_question_api(question, response, question_type,
+                                                            language, theme_name, theme_importance)
+        )
+        self._cache_response(cache_key, result_data)
+        return result_data
+
+    def _generate_theme_based_question_api(self, question: str, response: str, question_type: str,
+                                           language: str, theme_name: str, theme_importance: int) -> QEResult:
+        """Issue the theme-based question API call (no caching or coalescing)."""
         prompt = self._build_theme_question_prompt(question, response, question_type, language, theme_name, theme_importance)
         
         payload = {
-            "model": "gpt-4o-mini",
+            **_GEN_PAYLOAD_SKELETON,
             "messages": [
                 {
                     "role": "system",
-                    "content": f"Generate a follow-up question in {language} that focuses on the detected theme '{theme_name}' and follows the specified question type. Return the question and explanation separately."
+                    "content": _SYS_THEME_QUESTION
                 },
                 {
+                    # Language/theme/type ride in a short user header so
+                    # the system prefix stays identical across languages
                     "role": "user",
-                    "content": prompt
+                    "content": f"Language: {language}\nTheme: {theme_name} ({theme_importance}%)\nType: {question_type}\n\n{prompt}"
                 }
-            ],
-            "temperature": 0.7,
-            "max_tokens": 200,
-            "top_p": 0.9,
-            "frequency_penalty": 0.0,
-            "presence_penalty": 0.0,
-            "stream": False
+            ]
         }
 
         response_data = self.session.post(
             self.API_URL,
-            headers=self._get_headers(),
-            json=payload,
+            data=orjson.dumps(payload),
             timeout=self.TIMEOUT
         )
-        response_data.raise_for_status()
-        
-        result = response_data.json()
-        content = result["choices"][0]["message"]["content"].strip()
+        if response_data.status_code >= 400:
+            raise OpenAIAPIError(f"HTTP {response_data.status_code}: {response_data.text[:200]}")
         
-        # Parse question and explanation
-        question_text, explanation = self._parse_question_and_explanation(content)
+        result = orjson.loads(response_data.content)
+        content = self._extract_content(result).strip()
         
-        # Clean the question text
-        question_text = self._clean_question_text(question_text)
+        # Parse question/explanation and clean the question in one pass
+        question_text, explanation = self._parse_and_clean(content)
         
         # Validate and fix question type compliance
         is_compliant, reason = self._validate_question_type_compliance(question_text, question_type)
         if not is_compliant:
             self.logger.warning(f"Question type compliance issue: {reason}")
             question_text = self._fix_overlapping_question(question_text, question_type)
-        
-        result_data = {"question": question_text, "explanation": explanation}
-        self._cache_response(cache_key, result_data)
-        return result_data
+
+        return QEResult(question=question_text, explanation=explanation)
 
     def _generate_missing_theme_question(self, question: str, response: str, language: str, 
-                                       theme_name: str, theme_importance: int) -> dict:
+                                       theme_name: str, theme_importance: int) -> QEResult:
         """
         Generate a question asking why important themes weren't mentioned.
 
@@ -1635,13 +2695,35 @@ Choose the theme with the highest importance if multiple themes are found."""
             theme_importance (int): The importance percentage.
 
         Returns:
-            dict: Dictionary containing question and explanation.
+            QEResult: The generated question and its explanation.
         """
-        cache_key = self._get_cache_key(f"missing_theme:{question}:{response}:{language}:{theme_name}")
+        cache_key = self._get_cache_key(f"missing_theme:{question}:{_normalize_for_cache(response)}:{language}:{theme_name}")
         cached_result = self._get_cached_response(cache_key)
         if cached_result:
             return cached_result
 
+        # Templatic fast path: the prompt below yields an essentially
+        # fixed-shape question, so known languages skip the API call
+        template = _MISSING_THEME_TEMPLATES.get(language) if _USE_MISSING_THEME_TEMPLATES else None
+        if template:
+            result_data = QEResult(
+                question=template.format(theme=theme_name),
+                explanation=f"Asks about the missing high-importance theme '{theme_name}'."
+            )
+            self._cache_response(cache_key, result_data)
+            return result_data
+
+        result_data = self._singleflight(
+            cache_key,
+            lambda: self._generate_missing_theme_question_api(question, response, language,
+                                                              theme_name, theme_importance)
+        )
+        self._cache_response(cache_key, result_data)
+        return result_data
+
+    def _generate_missing_theme_question_api(self, question: str, response: str, language: str,
+                                             theme_name: str, theme_importance: int) -> QEResult:
+        """Issue the missing-theme question API call (no caching or coalescing)."""
         prompt = f"""Original Question: {question}
 User Response: {response}
 
@@ -1655,51 +2737,40 @@ Question: [Your question here]
 Explanation: [Explain how this question addresses the missing theme]"""
 
         payload = {
-            "model": "gpt-4o-mini",
+            **_GEN_PAYLOAD_SKELETON,
             "messages": [
                 {
                     "role": "system",
-                    "content": f"Generate a follow-up question in {language} about missing important themes."
+                    "content": _SYS_MISSING_THEME
                 },
                 {
                     "role": "user",
-                    "content": prompt
+                    "content": f"Language: {language}\nTheme: {theme_name} ({theme_importance}%)\n\n{prompt}"
                 }
-            ],
-            "temperature": 0.7,
-            "max_tokens": 200,
-            "top_p": 0.9,
-            "frequency_penalty": 0.0,
-            "presence_penalty": 0.0,
-            "stream": False
+            ]
         }
 
         response_data = self.session.post(
             self.API_URL,
-            headers=self._get_headers(),
-            json=payload,
+            data=orjson.dumps(payload),
             timeout=self.TIMEOUT
         )
-        response_data.raise_for_status()
+        if response_data.status_code >= 400:
+            raise OpenAIAPIError(f"HTTP {response_data.status_code}: {response_data.text[:200]}")
         
-        result = response_data.json()
-        content = result["choices"][0]["message"]["content"].strip()
+        result = orjson.loads(response_data.content)
+        content = self._extract_content(result).strip()
         
-        # Parse question and explanation
-        question_text, explanation = self._parse_question_and_explanation(content)
-        
-        # Clean the question text
-        question_text = self._clean_question_text(question_text)
+        # Parse question/explanation and clean the question in one pass
+        question_text, explanation = self._parse_and_clean(content)
         
         # Validate and fix question type compliance (missing theme questions are typically reason type)
         is_compliant, reason = self._validate_question_type_compliance(question_text, "reason")
         if not is_compliant:
             self.logger.warning(f"Question type compliance issue: {reason}")
             question_text = self._fix_overlapping_question(question_text, "reason")
-        
-        result_data = {"question": question_text, "explanation": explanation}
-        self._cache_response(cache_key, result_data)
-        return result_data
+
+        return QEResult(question=question_text, explanation=explanation)
 
     @staticmethod
     def _build_theme_question_prompt(question: str, response: str, question_type: str, 
@@ -1719,38 +2790,7 @@ Explanation: [Explain how this question addresses the missing theme]"""
             str: The formatted prompt for theme-based question generation.
         """
         # Define strict boundaries for each question type (non-overlapping)
-        type_boundaries = {
-            'reason': {
-                'focus': 'WHY they think/feel this way about the theme',
-                'avoid': 'examples, details, effects, comparisons',
-                'keywords': ['why', 'reason', 'motivation', 'thinking', 'feeling']
-            },
-            'clarification': {
-                'focus': 'CLARIFY unclear terms or concepts related to the theme',
-                'avoid': 'examples, details, reasons, effects',
-                'keywords': ['clarify', 'mean', 'understand', 'explain']
-            },
-            'elaboration': {
-                'focus': 'MORE DETAILS about their response regarding the theme',
-                'avoid': 'examples, reasons, effects, comparisons',
-                'keywords': ['details', 'more', 'expand', 'elaborate']
-            },
-            'example': {
-                'focus': 'SPECIFIC EXAMPLES or instances of the theme',
-                'avoid': 'reasons, details, effects, comparisons',
-                'keywords': ['example', 'instance', 'case', 'specific']
-            },
-            'impact': {
-                'focus': 'EFFECTS or CONSEQUENCES of the theme',
-                'avoid': 'reasons, examples, details, comparisons',
-                'keywords': ['effect', 'impact', 'consequence', 'result']
-            },
-            'comparison': {
-                'focus': 'COMPARISON with alternatives related to the theme',
-                'avoid': 'reasons, examples, details, effects',
-                'keywords': ['compare', 'versus', 'difference', 'alternative']
-            }
-        }
+        type_boundaries = _TYPE_BOUNDARIES_THEME
         
         boundary = type_boundaries.get(question_type.lower(), {})
         focus = boundary.get('focus', f"ask about {question_type}")
@@ -1783,35 +2823,535 @@ Explanation: [Explain how this question focuses on the theme and question type]"
         Returns:
             tuple: (question_text, explanation)
         """
-        lines = content.split('\n')
         question_text = ""
         explanation = ""
-        in_question = False
-        in_explanation = False
-        
-        for line in lines:
-            line = line.strip()
-            if line.lower().startswith('question:'):
-                in_question = True
-                in_explanation = False
-                question_text = line[9:].strip()  # Remove "Question: "
-            elif line.lower().startswith('explanation:'):
-                in_question = False
-                in_explanation = True
-                explanation = line[12:].strip()  # Remove "Explanation: "
-            elif in_question and line:
-                question_text += " " + line
-            elif in_explanation and line:
-                explanation += " " + line
-        
-        # Clean up
-        question_text = question_text.strip()
-        explanation = explanation.strip()
+
+        match = _QUESTION_EXPLANATION_RE.search(content)
+        if match:
+            # Collapse continuation lines into single-space-separated text
+            question_text = " ".join(match.group("question").split())
+            if match.group("explanation"):
+                explanation = " ".join(match.group("explanation").split())
         
         # Fallback if parsing fails
         if not question_text:
             question_text = content.strip()
         if not explanation:
             explanation = "Generated follow-up question based on theme and question type."
-        
-        return question_text, explanation 
\ No newline at end of file
+
+        return question_text, explanation
+
+    def _parse_and_clean(self, content: str) -> tuple:
+        """
+        Parse question/explanation and clean the question in one pass.
+
+        Fuses _parse_question_and_explanation and _clean_question_text so
+        the question string is only walked once on the generation hot path.
+
+        Args:
+            content (str): The AI response content.
+
+        Returns:
+            tuple: (cleaned_question_text, explanation)
+        """
+        question_text, explanation = self._parse_question_and_explanation(content)
+        return self._clean_question_text(question_text), explanation
+
+
+_SERVICE_SINGLETON: Optional["OpenAIService"] = None
+_SERVICE_SINGLETON_LOCK = threading.Lock()
+
+
+def get_openai_service() -> "OpenAIService":
+    """
+    Return the process-wide shared OpenAIService instance.
+
+    Instantiating OpenAIService per request rebuilds the session, retry
+    adapter, and cache, so nothing is reused across requests. Routing all
+    handlers through this accessor gives them one TLS connection pool and
+    one cache per process.
+
+    Returns:
+        OpenAIService: The lazily created shared service instance.
+    """
+    global _SERVICE_SINGLETON
+    if _SERVICE_SINGLETON is None:
+        with _SERVICE_SINGLETON_LOCK:
+            if _SERVICE_SINGLETON is None:
+                _SERVICE_SINGLETON = OpenAIService()
+    return _SERVICE_SINGLETON
+
+
+class _FollowupBatcher:
+    """
+    Micro-batcher that coalesces concurrent follow-up generation calls.
+
+    Same shape as _ThemeBatcher: callers submit (prompt, allowed_types)
+    and block on a Future; the dispatcher packs up to MAX_BATCH pending
+    prompts within a MAX_WAIT_MS window into one numbered API request.
+    Only active when OPENAI_FOLLOWUP_BATCHING is enabled.
+    """
+
+    MAX_BATCH = 8
+    MAX_WAIT_MS = 20
+
+    def __init__(self, service: OpenAIService):
+        self._service = service
+        self._queue: "queue.Queue[tuple]" = queue.Queue()
+        self._worker = threading.Thread(target=self._run, name="followup-batcher", daemon=True)
+        self._worker.start()
+
+    def submit(self, prompt: str, allowed_types: Optional[list]) -> "concurrent.futures.Future":
+        """Queue one follow-up generation request and return its Future."""
+        future = concurrent.futures.Future()
+        self._queue.put((prompt, allowed_types, future))
+        return future
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.MAX_WAIT_MS / 1000.0
+            while len(batch) < self.MAX_BATCH:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._dispatch(batch)
+
+    def _single(self, prompt: str, allowed_types: Optional[list]) -> list:
+        api_response = self._service.generate_questions(prompt)
+        return self._service.parse_response(api_response, allowed_types)
+
+    def _dispatch(self, batch: list):
+        if len(batch) == 1:
+            prompt, allowed_types, future = batch[0]
+            try:
+                future.set_result(self._single(prompt, allowed_types))
+            except Exception as exc:
+                future.set_exception(exc)
+            return
+
+        try:
+            results = self._service._generate_followups_batch_api([(p, a) for p, a, _ in batch])
+            for (_, _, future), result in zip(batch, results):
+                future.set_result(result)
+        except Exception:
+            # Batched call failed; retry each item individually
+            for prompt, allowed_types, future in batch:
+                try:
+                    future.set_result(self._single(prompt, allowed_types))
+                except Exception as exc:
+                    future.set_exception(exc)
+
+
+class _ThemeBatcher:
+    """
+    Micro-batcher that coalesces concurrent theme-detection calls.
+
+    Callers submit (response, themes) pairs and block on a Future; a
+    dispatcher thread collects up to MAX_BATCH pending items within a
+    MAX_WAIT_MS window and resolves them with one batched API call,
+    amortizing HTTP, TLS, and rate-limit budget across callers. Cache
+    lookups happen before submission, so only true misses are batched.
+    """
+
+    MAX_BATCH = 8
+    MAX_WAIT_MS = 20
+
+    def __init__(self, service: OpenAIService):
+        self._service = service
+        self._queue: "queue.Queue[tuple]" = queue.Queue()
+        self._worker = threading.Thread(target=self._run, name="theme-batcher", daemon=True)
+        self._worker.start()
+
+    def submit(self, response: str, themes: list) -> "concurrent.futures.Future":
+        """Queue one theme-detection request and return its Future."""
+        future = concurrent.futures.Future()
+        self._queue.put((response, themes, future))
+        return future
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.MAX_WAIT_MS / 1000.0
+            while len(batch) < self.MAX_BATCH:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._dispatch(batch)
+
+    def _dispatch(self, batch: list):
+        if len(batch) == 1:
+            response, themes, future = batch[0]
+            try:
+                future.set_result(self._service._detect_themes_api(response, themes))
+            except Exception as exc:
+                future.set_exception(exc)
+            return
+
+        try:
+            results = self._service._detect_themes_batch_api([(r, t) for r, t, _ in batch])
+            for (_, _, future), result in zip(batch, results):
+                future.set_result(result)
+        except Exception:
+            # Batched call failed; retry each item individually
+            for response, themes, future in batch:
+                try:
+                    future.set_result(self._service._detect_themes_api(response, themes))
+                except Exception as exc:
+                    future.set_exception(exc)
+
+
+class AsyncOpenAIService(OpenAIService):
+    """
+    Async variant of OpenAIService for callers running on an event loop.
+
+    Shares the prompt builders, parsers, and cache with the sync service but
+    issues requests on an httpx.AsyncClient with HTTP/2, so many in-flight
+    calls multiplex over one connection instead of blocking worker threads.
+    The sync OpenAIService remains available for non-async callers.
+    """
+
+    # Per-attempt deadline, deliberately tighter than TIMEOUT: retrying a
+    # stalled request beats waiting out the provider's tail latency
+    REQUEST_TIMEOUT = float(os.getenv("OPENAI_REQUEST_TIMEOUT", "8.0"))
+    REQUEST_ATTEMPTS = 3
+
+    def __init__(self):
+        """
+        Initialize the AsyncOpenAIService with an HTTP/2 async client.
+        """
+        super().__init__()
+        self.client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            timeout=self.TIMEOUT
+        )
+
+    async def aclose(self):
+        """Close the underlying async client."""
+        await self.client.aclose()
+
+    async def _apost(self, payload: Dict[str, Any]) -> httpx.Response:
+        """
+        POST the payload with a tight per-attempt timeout and retries.
+
+        Each attempt gets REQUEST_TIMEOUT seconds; timeouts and transport
+        errors are retried up to REQUEST_ATTEMPTS times with a short
+        jittered backoff after the second failure, trading a little
+        wasted compute for a much lower p99.
+
+        Args:
+            payload (Dict[str, Any]): The chat-completion payload.
+
+        Returns:
+            httpx.Response: The HTTP response of the first successful attempt.
+
+        Raises:
+            OpenAIAPIError: When the retry budget is exhausted.
+        """
+        body = orjson.dumps(payload)
+        last_exc: Optional[Exception] = None
+        for attempt in range(self.REQUEST_ATTEMPTS):
+            if attempt >= 2:
+                await asyncio.sleep(0.2 * attempt + random.uniform(0, 0.1))
+            try:
+                return await asyncio.wait_for(
+                    self.client.post(self.API_URL, headers=self._headers, content=body),
+                    timeout=self.REQUEST_TIMEOUT
+                )
+            except (asyncio.TimeoutError, httpx.HTTPError) as exc:
+                last_exc = exc
+                self.logger.warning(f"Async API attempt {attempt + 1} failed: {exc!r}")
+        raise OpenAIAPIError(f"Request failed after {self.REQUEST_ATTEMPTS} attempts: {last_exc}")
+
+    async def generate_questions(self, prompt: str) -> Dict[str, Any]:
+        """
+        Async version of generate_questions.
+
+        Args:
+            prompt (str): The prompt to send to the LLM.
+
+        Returns:
+            Dict[str, Any]: The API response JSON.
+
+        Raises:
+            OpenAIAPIError: If the API call fails.
+        """
+        start_time = time.time()
+        payload = self._build_questions_payload(prompt)
+        try:
+            response = await self._apost(payload)
+            if response.status_code == 200:
+                response_data = orjson.loads(response.content)
+
+                elapsed_time = time.time() - start_time
+                self.logger.info(f"OpenAI API call completed in {elapsed_time:.2f}s")
+
+                return response_data
+            else:
+                self.logger.error(f"OpenAI API error: {response.status_code} {response.text}")
+                raise OpenAIAPIError(f"API error: {response.status_code} {response.text}")
+        except httpx.HTTPError as exc:
+            self.logger.error(f"OpenAI API request failed: {exc}")
+            raise OpenAIAPIError(f"Request failed: {exc}")
+
+    async def generate_multilingual_question(self, question: str, response: str, question_type: str, language: str) -> str:
+        """
+        Async version of generate_multilingual_question.
+
+        Args:
+            question (str): The original survey question.
+            response (str): The user's answer.
+            question_type (str): The type of follow-up question.
+            language (str): The target language.
+
+        Returns:
+            str: The generated question in the target language.
+
+        Raises:
+            OpenAIAPIError: If the API call fails.
+        """
+        cache_key = self._get_cache_key(f"{question}:{response}:{question_type}:{language}")
+        cached_response = self._get_cached_response(cache_key)
+        if cached_response:
+            return cached_response
+
+        start_time = time.time()
+        prompt = self._build_multilingual_prompt(question, response, question_type, language)
+        payload = self._build_multilingual_payload(prompt, language)
+
+        try:
+            api_response = await self._apost(payload)
+            if api_response.status_code == 200:
+                response_data = orjson.loads(api_response.content)
+                return self._finalize_multilingual_question(response_data, question_type, cache_key, start_time)
+            else:
+                self.logger.error(f"OpenAI API error: {api_response.status_code} {api_response.text}")
+                raise OpenAIAPIError(f"API error: {api_response.status_code} {api_response.text}")
+        except httpx.HTTPError as exc:
+            self.logger.error(f"Multilingual API request failed: {exc}")
+            raise OpenAIAPIError(f"Request failed: {exc}")
+
+    async def adetect_informativeness(self, question: str, response: str, language: str = "English") -> bool:
+        """
+        Async version of detect_informativeness.
+
+        Args:
+            question (str): The original survey question.
+            response (str): The user's answer.
+            language (str): The language of the question and response.
+
+        Returns:
+            bool: True if response is informative, False if non-informative.
+
+        Raises:
+            OpenAIAPIError: If the API call fails.
+        """
+        cache_key = self._get_cache_key(f"informativeness:{question}:{_normalize_for_cache(response)}:{language}")
+        cached_response = self._get_cached_response(cache_key)
+        if cached_response:
+            return cached_response
+
+        prompt = self._build_informativeness_prompt(question, response, language)
+        payload = self._build_informativeness_payload(prompt)
+
+        try:
+            api_response = await self._apost(payload)
+            if api_response.status_code != 200:
+                self.logger.error(f"OpenAI API error: {api_response.status_code} {api_response.text}")
+                raise OpenAIAPIError(f"API error: {api_response.status_code} {api_response.text}")
+
+            content = self._extract_content(orjson.loads(api_response.content))
+            if not content:
+                raise OpenAIAPIError("No content in informativeness response.")
+
+            is_informative = content.strip() == "1"
+            self._cache_response(cache_key, is_informative, persist=True)
+            return is_informative
+        except httpx.HTTPError as exc:
+            self.logger.error(f"Informativeness detection request failed: {exc}")
+            raise OpenAIAPIError(f"Request failed: {exc}")
+
+    async def adetect_themes_in_response(self, response: str, themes: list) -> Optional[ThemeResult]:
+        """
+        Async version of detect_themes_in_response.
+
+        Args:
+            response (str): The user's response to analyze.
+            themes (list): List of theme dictionaries with 'name' and 'importance' keys.
+
+        Returns:
+            Optional[ThemeResult]: Detected theme info or None if no themes found.
+        """
+        cache_key = self._get_cache_key(f"theme_detection:{_normalize_for_cache(response)}:{self._themes_key(themes)}")
+        cached_result = self._get_cached_response(cache_key)
+        if cached_result:
+            return cached_result
+
+        try:
+            prompt = self._build_theme_detection_prompt(
+                response, tuple((t["name"], t["importance"]) for t in themes))
+            payload = self._build_theme_detection_payload(prompt)
+
+            api_response = await self._apost(payload)
+            if api_response.status_code >= 400:
+                raise OpenAIAPIError(f"HTTP {api_response.status_code}: {api_response.text[:200]}")
+
+            content = self._extract_content(orjson.loads(api_response.content)).strip()
+            result_data = self._parse_theme_detection_content(content, response, themes)
+            self._cache_response(cache_key, result_data, persist=True)
+            return result_data
+        except Exception as e:
+            self.logger.error(f"Theme detection failed: {e}")
+            return None
+
+    async def agenerate_theme_enhanced_question(self, question: str, response: str, question_type: str,
+                                                language: str, theme: str,
+                                                theme_parameters: Optional[dict] = None) -> dict:
+        """
+        Async version of generate_theme_enhanced_question.
+
+        Runs informativeness and theme detection concurrently on the event
+        loop instead of on worker threads.
+
+        Args:
+            question (str): The original survey question.
+            response (str): The user's response to the question.
+            question_type (str): The type of follow-up question to generate.
+            language (str): The target language for the response.
+            theme (str): "Yes" to enable theme analysis, "No" for standard workflow.
+            theme_parameters (Optional[dict]): Theme parameters when theme="Yes".
+
+        Returns:
+            dict: Dictionary containing response data with theme information.
+
+        Raises:
+            OpenAIAPIError: If there's an error calling the OpenAI API.
+        """
+        if theme.lower() == "no":
+            question_text = await self.generate_multilingual_question(question, response, question_type, language)
+            return {
+                "informative": 1,
+                "question": question_text,
+                "theme": theme,
+                "detected_theme": None,
+                "theme_importance": None,
+                "highest_importance_theme": None
+            }
+
+        if not theme_parameters or not theme_parameters.get("themes"):
+            raise ValueError("Theme parameters required when theme='Yes'")
+
+        themes = [{"name": t["name"], "importance": t["importance"]} for t in theme_parameters["themes"]]
+
+        is_informative, detected_theme = await asyncio.gather(
+            self.adetect_informativeness(question, response, language),
+            self.adetect_themes_in_response(response, themes)
+        )
+
+        if not is_informative:
+            return {
+                "informative": 0,
+                "question": None,
+                "theme": theme,
+                "detected_theme": None,
+                "theme_importance": None,
+                "highest_importance_theme": None
+            }
+
+        if detected_theme:
+            result = await asyncio.to_thread(
+                self._generate_theme_based_question,
+                question, response, question_type, language,
+                detected_theme.theme_name, detected_theme.importance
+            )
+            return {
+                "informative": 1,
+                "question": result.question,
+                "explanation": result.explanation,
+                "theme": theme,
+                "detected_theme": detected_theme.theme_name,
+                "theme_importance": detected_theme.importance,
+                "highest_importance_theme": None
+            }
+        else:
+            highest_theme = max(themes, key=lambda x: x["importance"])
+            result = await asyncio.to_thread(
+                self._generate_missing_theme_question,
+                question, response, language, highest_theme["name"], highest_theme["importance"]
+            )
+            return {
+                "informative": 1,
+                "question": result.question,
+                "explanation": result.explanation,
+                "theme": theme,
+                "detected_theme": None,
+                "theme_importance": None,
+                "highest_importance_theme": highest_theme["name"]
+            }
+
+    async def generate_multilingual_questions(self, question: str, response: str,
+                                              question_types: List[str], language: str) -> List[str]:
+        """
+        Generate multiple multilingual follow-up questions concurrently.
+
+        Args:
+            question (str): The original survey question.
+            response (str): The user's answer.
+            question_types (List[str]): The follow-up question types to generate.
+            language (str): The target language.
+
+        Returns:
+            List[str]: The generated questions, one per requested type.
+        """
+        return list(await asyncio.gather(*[
+            self.generate_multilingual_question(question, response, qt, language)
+            for qt in question_types
+        ]))
+
+    async def generate_multilingual_questions_batch(self, tasks: List[dict],
+                                                    max_concurrency: int = 10) -> List[str]:
+        """
+        Fan out arbitrary (question, response, type, language) tasks concurrently.
+
+        Latency collapses from sum-of-round-trips to roughly the slowest
+        single call; the semaphore keeps the fan-out inside API rate limits.
+
+        Args:
+            tasks (List[dict]): Dicts with 'question', 'response', 'type' and 'language' keys.
+            max_concurrency (int): Maximum number of API calls in flight at once.
+
+        Returns:
+            List[str]: Generated questions in the same order as tasks.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(task: dict) -> str:
+            async with semaphore:
+                return await self.generate_multilingual_question(
+                    task["question"], task["response"], task["type"], task["language"]
+                )
+
+        return list(await asyncio.gather(*[run(task) for task in tasks]))
+
+    def generate_multilingual_questions_batch_sync(self, tasks: List[dict],
+                                                   max_concurrency: int = 10) -> List[str]:
+        """
+        Synchronous wrapper around generate_multilingual_questions_batch.
+
+        Args:
+            tasks (List[dict]): Dicts with 'question', 'response', 'type' and 'language' keys.
+            max_concurrency (int): Maximum number of API calls in flight at once.
+
+        Returns:
+            List[str]: Generated questions in the same order as tasks.
+        """
+        return asyncio.run(self.generate_multilingual_questions_batch(tasks, max_concurrency))
\ No newline at end of file
@@ -1,3 +1,11 @@
+"""
+Error payload schemas for the API.
+
+Handlers build these shapes as plain dicts and emit them with orjson;
+the models document the error contract rather than being instantiated
+on the error path.
+"""
+
 from pydantic import BaseModel, Field
 from typing import Optional
 
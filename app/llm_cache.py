@@ -0,0 +1,127 @@
+"""
+Optional persistent cache backends for LLM results.
+
+The in-memory cache in OpenAIService is per-process: every fresh worker
+or restart starts cold. A persistent backend shares deterministic
+results (informativeness, theme detection, generated questions) across
+processes and restarts. Select one with the OPENAI_CACHE_BACKEND
+environment variable:
+
+    OPENAI_CACHE_BACKEND=sqlite   stdlib SQLite file (OPENAI_CACHE_PATH)
+    OPENAI_CACHE_BACKEND=redis    Redis server (OPENAI_CACHE_REDIS_URL)
+
+Unset or any other value disables the persistent layer; the in-memory
+cache keeps working either way.
+"""
+
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from typing import Any, Optional, Protocol
+
+
+class CacheBackend(Protocol):
+    """Minimal interface a persistent cache backend must provide."""
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None if absent/expired."""
+        ...
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        """Store value under key for ttl seconds."""
+        ...
+
+
+class SqliteBackend:
+    """
+    SQLite-backed cache using only the standard library.
+
+    Values are pickled, so anything the service caches (bools, lists,
+    msgspec structs, tuples of them) round-trips unchanged. A single
+    shared connection is guarded by a lock; SQLite serializes writes
+    anyway, so finer-grained locking buys nothing here.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self._path = path or os.getenv("OPENAI_CACHE_PATH", "llm_cache.sqlite3")
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self._path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        value, expires_at = row
+        if expires_at <= time.time():
+            with self._lock:
+                self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                self._conn.commit()
+            return None
+        return pickle.loads(value)
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, blob, time.time() + ttl),
+            )
+            self._conn.commit()
+
+
+class RedisBackend:
+    """
+    Redis-backed cache for multi-host deployments.
+
+    Requires the optional ``redis`` package; TTL handling is delegated
+    to Redis via SETEX so expired entries never need sweeping.
+    """
+
+    def __init__(self, url: Optional[str] = None):
+        import redis  # Optional dependency; only needed for this backend
+
+        self._client = redis.Redis.from_url(
+            url or os.getenv("OPENAI_CACHE_REDIS_URL", "redis://localhost:6379/0")
+        )
+
+    def get(self, key: str) -> Optional[Any]:
+        blob = self._client.get(key)
+        if blob is None:
+            return None
+        return pickle.loads(blob)
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        self._client.setex(key, ttl, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def get_cache_backend() -> Optional[CacheBackend]:
+    """
+    Build the persistent backend selected by OPENAI_CACHE_BACKEND.
+
+    Returns:
+        Optional[CacheBackend]: The configured backend, or None when the
+        persistent layer is disabled or its dependency is unavailable.
+    """
+    backend = os.getenv("OPENAI_CACHE_BACKEND", "").lower()
+    if backend == "sqlite":
+        return SqliteBackend()
+    if backend == "redis":
+        try:
+            return RedisBackend()
+        except ImportError:
+            import logging
+            logging.getLogger("OpenAIService").warning(
+                "OPENAI_CACHE_BACKEND=redis but the redis package is not installed; "
+                "persistent caching disabled"
+            )
+    return None
@@ -1,10 +1,45 @@
 import logging
 
+import orjson
+import structlog
+
+def _orjson_dumps(obj, **kwargs) -> str:
+    """Serialize a log event dict with orjson (kwargs ignored for speed)."""
+    return orjson.dumps(obj).decode()
+
 def setup_logging():
     """
-    Set up logging configuration for the application.
+    Set up structured logging for the application.
+
+    All records — structlog loggers and the stdlib loggers already used
+    by the service and Flask — are rendered as JSON lines by orjson via
+    a single root handler. This avoids per-record %-format parsing and
+    keeps high-volume INFO logging cheap under load.
     """
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s %(levelname)s %(name)s %(threadName)s : %(message)s'
-    ) 
\ No newline at end of file
+    timestamper = structlog.processors.TimeStamper(fmt="iso", utc=True)
+
+    # Stdlib records (logging.getLogger call sites) pass through the same
+    # renderer; foreign_pre_chain adds the fields structlog would add.
+    formatter = structlog.stdlib.ProcessorFormatter(
+        foreign_pre_chain=[timestamper, structlog.processors.add_log_level],
+        processors=[
+            structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps),
+        ],
+    )
+    handler = logging.StreamHandler()
+    handler.setFormatter(formatter)
+    root = logging.getLogger()
+    root.handlers[:] = [handler]
+    root.setLevel(logging.INFO)
+
+    structlog.configure(
+        processors=[
+            timestamper,
+            structlog.processors.add_log_level,
+            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
+        ],
+        wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        cache_logger_on_first_use=True,
+    )
@@ -1,7 +1,29 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional
 from .question_types import QuestionType
 
+__all__ = [
+    "GenerateFollowupRequest",
+    "FollowupQuestion",
+    "GenerateFollowupResponse",
+    "SingleReasonRequest",
+    "SingleReasonResponse",
+    "MultilingualQuestionRequest",
+    "MultilingualQuestionResponse",
+    "EnhancedMultilingualRequest",
+    "EnhancedMultilingualResponse",
+    "ThemeParameter",
+    "ThemeParameters",
+    "ScoreBatchRequest",
+    "ScoreBatchItem",
+    "ScoreBatchResponse",
+    "ThemeEnhancedRequest",
+    "ThemeEnhancedBatchRequest",
+    "ThemeEnhancedResponse",
+    "ThemeEnhancedOptionalRequest",
+    "ThemeEnhancedOptionalResponse",
+]
+
 class GenerateFollowupRequest(BaseModel):
     """
     Request model for generating follow-up questions.
@@ -11,6 +33,8 @@ class GenerateFollowupRequest(BaseModel):
         response (str): The user's answer to the survey question.
         allowed_types (Optional[List[QuestionType]]): Optional list of allowed follow-up question types.
     """
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     question: str = Field(..., description="The original survey question.")
     response: str = Field(..., description="The user's answer to the survey question.")
     allowed_types: Optional[List[QuestionType]] = Field(None, description="Optional list of allowed follow-up question types.")
@@ -23,6 +47,8 @@ class FollowupQuestion(BaseModel):
         type (QuestionType): The type of follow-up question.
         text (str): The follow-up question text.
     """
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     type: QuestionType
     text: str
 
@@ -33,6 +59,8 @@ class GenerateFollowupResponse(BaseModel):
     Args:
         followups (List[FollowupQuestion]): List of generated follow-up questions.
     """
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     followups: List[FollowupQuestion]
 
 class SingleReasonRequest(BaseModel):
@@ -43,6 +71,8 @@ class SingleReasonRequest(BaseModel):
         question (str): The original survey question.
         response (str): The user's answer to the survey question.
     """
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     question: str = Field(..., description="The original survey question.")
     response: str = Field(..., description="The user's answer to the survey question.")
 
@@ -55,6 +85,8 @@ class SingleReasonResponse(BaseModel):
         original_question (str): The original survey question.
         original_response (str): The original user response.
     """
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     question: str = Field(..., description="The generated reason-based follow-up question.")
     original_question: str = Field(..., description="The original survey question.")
     original_response: str = Field(..., description="The original user response.")
@@ -69,6 +101,8 @@ class MultilingualQuestionRequest(BaseModel):
         type (str): The type of follow-up question (reason, impact, elaboration, etc.).
         language (str): The target language for the response (e.g., "Chinese", "Japanese", "Spanish").
     """
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     question: str = Field(..., description="The original survey question (in the target language).")
     response: str = Field(..., description="The user's answer to the survey question (in the target language).")
     type: str = Field(..., description="The type of follow-up question.")
@@ -85,6 +119,8 @@ class MultilingualQuestionResponse(BaseModel):
         type (str): The type of follow-up question generated.
         language (str): The language of the generated question.
     """
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     question: str = Field(..., description="The generated follow-up question in the target language.")
     original_question: str = Field(..., description="The original survey question.")
     original_response: str = Field(..., description="The original user response.")
@@ -101,6 +137,8 @@ class EnhancedMultilingualRequest(BaseModel):
         type (str): The type of follow-up question (reason, impact, elaboration, etc.).
         language (str): The target language for the response (e.g., "Chinese", "Japanese", "Spanish").
     """
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     question: str = Field(..., description="The original survey question (in the target language).")
     response: str = Field(..., description="The user's answer to the survey question (in the target language).")
     type: str = Field(..., description="The type of follow-up question.")
@@ -118,6 +156,8 @@ class EnhancedMultilingualResponse(BaseModel):
         type (str): The type of follow-up question requested.
         language (str): The language of the generated question.
     """
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     informative: int = Field(..., description="1 if response is informative, 0 if non-informative.")
     question: Optional[str] = Field(None, description="The generated follow-up question (only if informative=1).")
     original_question: str = Field(..., description="The original survey question.")
@@ -133,6 +173,8 @@ class ThemeParameter(BaseModel):
         name (str): The name of the theme.
         importance (int): The importance percentage (0-100).
     """
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     name: str = Field(..., description="The name of the theme.")
     importance: int = Field(..., ge=0, le=100, description="The importance percentage (0-100).")
 
@@ -143,7 +185,52 @@ class ThemeParameters(BaseModel):
     Args:
         themes (List[ThemeParameter]): List of themes with their importance percentages (1-10 themes allowed).
     """
-    themes: List[ThemeParameter] = Field(..., min_items=1, max_items=10, description="List of themes with their importance percentages (1-10 themes allowed).")
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    themes: List[ThemeParameter] = Field(..., min_length=1, max_length=10, description="List of themes with their importance percentages (1-10 themes allowed).")
+
+class ScoreBatchRequest(BaseModel):
+    """
+    Request model for scoring multiple responses to one question in a single call.
+
+    Args:
+        question (str): The original survey question.
+        responses (List[str]): The users' answers to score (1-50 responses).
+        language (str): The language of the question and responses.
+        theme_parameters (Optional[ThemeParameters]): Themes to detect (omit to skip theme detection).
+    """
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    question: str = Field(..., description="The original survey question.")
+    responses: List[str] = Field(..., min_length=1, max_length=50, description="The users' answers to score (1-50 responses).")
+    language: str = Field("English", description="The language of the question and responses.")
+    theme_parameters: Optional[ThemeParameters] = Field(None, description="Themes to detect (omit to skip theme detection).")
+
+class ScoreBatchItem(BaseModel):
+    """
+    Model for one scored response in a batch.
+
+    Args:
+        informative (int): 1 if the response is informative, 0 otherwise.
+        detected_theme (Optional[str]): The theme detected in the response (if any).
+        theme_importance (Optional[int]): The importance percentage of the detected theme.
+    """
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    informative: int = Field(..., description="1 if the response is informative, 0 otherwise.")
+    detected_theme: Optional[str] = Field(None, description="The theme detected in the response (if any).")
+    theme_importance: Optional[int] = Field(None, description="The importance percentage of the detected theme.")
+
+class ScoreBatchResponse(BaseModel):
+    """
+    Response model for batch scoring.
+
+    Args:
+        results (List[ScoreBatchItem]): Per-response results, in input order.
+    """
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    results: List[ScoreBatchItem]
 
 class ThemeEnhancedRequest(BaseModel):
     """
@@ -157,6 +244,8 @@ class ThemeEnhancedRequest(BaseModel):
         theme (str): "Yes" to enable theme analysis, "No" for standard workflow.
         theme_parameters (Optional[ThemeParameters]): Theme parameters (required when theme="Yes").
     """
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     question: str = Field(..., description="The original survey question (in the target language).")
     response: str = Field(..., description="The user's answer to the survey question (in the target language).")
     type: str = Field(..., description="The type of follow-up question.")
@@ -164,6 +253,17 @@ class ThemeEnhancedRequest(BaseModel):
     theme: str = Field(..., description="'Yes' to enable theme analysis, 'No' for standard workflow.")
     theme_parameters: Optional[ThemeParameters] = Field(None, description="Theme parameters (required when theme='Yes').")
 
+class ThemeEnhancedBatchRequest(BaseModel):
+    """
+    Request model for batched theme-enhanced question generation.
+
+    Args:
+        items (List[ThemeEnhancedRequest]): The requests to process concurrently (1-50 items).
+    """
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    items: List[ThemeEnhancedRequest] = Field(..., min_length=1, max_length=50, description="The requests to process concurrently (1-50 items).")
+
 class ThemeEnhancedResponse(BaseModel):
     """
     Response model for theme-enhanced multilingual follow-up question.
@@ -181,6 +281,8 @@ class ThemeEnhancedResponse(BaseModel):
         theme_importance (Optional[int]): The importance percentage of detected theme.
         highest_importance_theme (Optional[str]): The highest importance theme (when no themes found).
     """
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     informative: int = Field(..., description="1 if response is informative, 0 if non-informative.")
     question: Optional[str] = Field(None, description="The generated follow-up question (only if informative=1).")
     explanation: Optional[str] = Field(None, description="Explanation of how the question was generated (only if informative=1).")
@@ -206,6 +308,8 @@ class ThemeEnhancedOptionalRequest(BaseModel):
         check_informative (bool): Whether to check if response is informative (True) or skip detection (False).
         theme_parameters (Optional[ThemeParameters]): Theme parameters (required when theme="Yes").
     """
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     question: str = Field(..., description="The original survey question (in the target language).")
     response: str = Field(..., description="The user's answer to the survey question (in the target language).")
     type: str = Field(..., description="The type of follow-up question.")
@@ -232,6 +336,8 @@ class ThemeEnhancedOptionalResponse(BaseModel):
         theme_importance (Optional[int]): The importance percentage of detected theme.
         highest_importance_theme (Optional[str]): The highest importance theme (when no themes found).
     """
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     informative: Optional[int] = Field(None, description="1 if response is informative, 0 if non-informative, None if not checked.")
     question: Optional[str] = Field(None, description="The generated follow-up question.")
     explanation: Optional[str] = Field(None, description="Explanation of how the question was generated (only if informative=1).")
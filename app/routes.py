@@ -1,13 +1,98 @@
+from functools import wraps
 from flask import Blueprint, request, jsonify, current_app, send_from_directory
 from pydantic import ValidationError
-from .models import GenerateFollowupRequest, GenerateFollowupResponse, FollowupQuestion, SingleReasonRequest, SingleReasonResponse, MultilingualQuestionRequest, MultilingualQuestionResponse, EnhancedMultilingualRequest, EnhancedMultilingualResponse, ThemeEnhancedRequest, ThemeEnhancedResponse, ThemeEnhancedOptionalRequest, ThemeEnhancedOptionalResponse
+from .models import GenerateFollowupRequest, SingleReasonRequest, MultilingualQuestionRequest, EnhancedMultilingualRequest, ThemeEnhancedRequest, ThemeEnhancedBatchRequest, ThemeEnhancedOptionalRequest, ScoreBatchRequest
 from .question_types import QuestionType
-from .error_models import ErrorResponse, ValidationErrorResponse
-from .deepseek_service import OpenAIService, OpenAIAPIError
+from .deepseek_service import OpenAIAPIError, get_openai_service
+import orjson
 # Authentication removed - no import needed
 
 bp = Blueprint('api', __name__)
 
+def _ojson(payload, status=200):
+    """
+    Serialize a plain dict straight to a JSON response with orjson.
+
+    Success payloads are built server-side from already-validated data,
+    so re-validating them through a response model is pure overhead;
+    this emits the dict in one orjson pass.
+
+    Args:
+        payload (dict): The response payload.
+        status (int): HTTP status code for the response.
+
+    Returns:
+        tuple: (Response, status) pair for Flask.
+    """
+    return current_app.response_class(orjson.dumps(payload), mimetype="application/json"), status
+
+def _validated(model):
+    """
+    Decorate a POST handler to parse and validate its request body.
+
+    Replaces the identical try/except block each handler carried:
+    the body is parsed with orjson, validated once through the given
+    request model, and the handler receives the validated instance.
+    Validation failures return the usual 422/400 error payloads.
+
+    Args:
+        model (type[BaseModel]): The request model to validate against.
+
+    Returns:
+        Callable: The decorator wrapping the handler.
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                data = orjson.loads(request.get_data())
+                req = model(**data)
+            except ValidationError as ve:
+                return _ojson({
+                    "detail": "Invalid request data.",
+                    "code": "validation_error",
+                    "errors": ve.errors()
+                }, 422)
+            except Exception as exc:
+                return _ojson({
+                    "detail": f"Malformed request: {exc}",
+                    "code": "bad_request"
+                }, 400)
+            return fn(req, *args, **kwargs)
+        return wrapper
+    return decorator
+
+# Fully static endpoint bodies, encoded once at import time
+_HEALTH_JSON = b'{"status":"ok"}'
+_QUESTION_TYPES_JSON = orjson.dumps({"question_types": [qt.value for qt in QuestionType]})
+_API_INFO_JSON = orjson.dumps({
+    "name": "Survey Intelligence API",
+    "description": "Generate intelligent follow-up questions for survey responses using OpenAI AI",
+    "version": "1.0.0",
+    "endpoints": {
+        "health": "/health",
+        "question_types": "/question-types",
+        "generate_followup": "/generate-followup",
+        "generate_reason": "/generate-reason",
+        "generate_multilingual": "/generate-multilingual",
+        "generate_enhanced_multilingual": "/generate-enhanced-multilingual",
+        "generate_theme_enhanced": "/generate-theme-enhanced",
+        "generate_theme_enhanced_optional": "/generate-theme-enhanced-optional",
+        "performance": "/performance"
+    },
+    "usage": {
+        "health": "GET /health - Check API status",
+        "question_types": "GET /question-types - Get available question types",
+        "generate_followup": "POST /generate-followup - Generate follow-up questions",
+        "generate_reason": "POST /generate-reason - Generate single reason-based question",
+        "generate_multilingual": "POST /generate-multilingual - Generate single multilingual question",
+        "generate_enhanced_multilingual": "POST /generate-enhanced-multilingual - Generate multilingual question with informativeness detection",
+        "generate_theme_enhanced": "POST /generate-theme-enhanced - Generate theme-enhanced multilingual question with theme analysis",
+        "generate_theme_enhanced_optional": "POST /generate-theme-enhanced-optional - Generate theme-enhanced multilingual question with optional informative detection",
+        "performance": "GET /performance - Get performance metrics"
+    }
+})
+
 # Root route to serve the frontend
 @bp.route('/', methods=['GET'])
 def serve_frontend():
@@ -24,33 +109,7 @@ def root():
     Returns:
         JSON: API information and available endpoints.
     """
-    return jsonify({
-        "name": "Survey Intelligence API",
-        "description": "Generate intelligent follow-up questions for survey responses using OpenAI AI",
-        "version": "1.0.0",
-        "endpoints": {
-            "health": "/health",
-            "question_types": "/question-types",
-            "generate_followup": "/generate-followup",
-            "generate_reason": "/generate-reason",
-            "generate_multilingual": "/generate-multilingual",
-            "generate_enhanced_multilingual": "/generate-enhanced-multilingual",
-            "generate_theme_enhanced": "/generate-theme-enhanced",
-            "generate_theme_enhanced_optional": "/generate-theme-enhanced-optional",
-            "performance": "/performance"
-        },
-        "usage": {
-            "health": "GET /health - Check API status",
-            "question_types": "GET /question-types - Get available question types",
-            "generate_followup": "POST /generate-followup - Generate follow-up questions",
-            "generate_reason": "POST /generate-reason - Generate single reason-based question",
-            "generate_multilingual": "POST /generate-multilingual - Generate single multilingual question",
-            "generate_enhanced_multilingual": "POST /generate-enhanced-multilingual - Generate multilingual question with informativeness detection",
-            "generate_theme_enhanced": "POST /generate-theme-enhanced - Generate theme-enhanced multilingual question with theme analysis",
-            "generate_theme_enhanced_optional": "POST /generate-theme-enhanced-optional - Generate theme-enhanced multilingual question with optional informative detection",
-            "performance": "GET /performance - Get performance metrics"
-        }
-    }), 200
+    return current_app.response_class(_API_INFO_JSON, mimetype="application/json"), 200
 
 @bp.route('/health', methods=['GET'])
 def health():
@@ -60,7 +119,7 @@ def health():
     Returns:
         JSON: Status message.
     """
-    return jsonify({"status": "ok"}), 200
+    return current_app.response_class(_HEALTH_JSON, mimetype="application/json"), 200
 
 @bp.route('/question-types', methods=['GET'])
 def question_types():
@@ -70,51 +129,37 @@ def question_types():
     Returns:
         JSON: List of question types.
     """
-    return jsonify({"question_types": [qt.value for qt in QuestionType]}), 200
+    return current_app.response_class(_QUESTION_TYPES_JSON, mimetype="application/json"), 200
 
 @bp.route('/generate-followup', methods=['POST'])
-def generate_followup():
+@_validated(GenerateFollowupRequest)
+def generate_followup(req):
     """
     Generate follow-up questions for a survey response.
 
     Returns:
         JSON: Generated follow-up questions or error.
     """
-    try:
-        data = request.get_json()
-        req = GenerateFollowupRequest(**data)
-    except ValidationError as ve:
-        return jsonify(ValidationErrorResponse(
-            detail="Invalid request data.",
-            code="validation_error",
-            errors=ve.errors()
-        ).dict()), 422
-    except Exception as exc:
-        return jsonify(ErrorResponse(
-            detail=f"Malformed request: {exc}",
-            code="bad_request"
-        ).dict()), 400
-
-    service = OpenAIService()
+    service = get_openai_service()
     allowed_types_list = [t.value for t in req.allowed_types] if req.allowed_types else None
     prompt = service.build_prompt(req.question, req.response, allowed_types_list)
     try:
-        api_response = service.generate_questions(prompt)
-        followups = service.parse_response(api_response, allowed_types_list)
-        response = GenerateFollowupResponse(
-            followups=[FollowupQuestion(type=QuestionType(f["type"]), text=f["text"]) for f in followups]
-        )
-        return jsonify(response.dict()), 200
+        followups = service.generate_followups(prompt, allowed_types_list)
+        # Service output is already normalized; QuestionType() still
+        # guards against an unexpected type string from the parser.
+        return _ojson({
+            "followups": [{"type": QuestionType(f["type"]).value, "text": f["text"]} for f in followups]
+        }, 200)
     except OpenAIAPIError as dse:
-        return jsonify(ErrorResponse(
-            detail=str(dse),
-            code="openai_error"
-        ).dict()), 502
+        return _ojson({
+            "detail": str(dse),
+            "code": "openai_error"
+        }, 502)
     except Exception as exc:
-        return jsonify(ErrorResponse(
-            detail=f"Internal server error: {exc}",
-            code="internal_error"
-        ).dict()), 500
+        return _ojson({
+            "detail": f"Internal server error: {exc}",
+            "code": "internal_error"
+        }, 500)
 
 @bp.route('/performance', methods=['GET'])
 def performance():
@@ -125,14 +170,15 @@ def performance():
         JSON: Performance metrics and cache statistics.
     """
     try:
-        from .deepseek_service import OpenAIService
-        service = OpenAIService()
+        service = get_openai_service()
         
         # Clean up cache
         service.cleanup_cache()
         
         return jsonify({
             "cache_size": len(service.cache),
+            "cache_hits": service.cache_stats["hits"],
+            "cache_misses": service.cache_stats["misses"],
             "cache_ttl": service.cache_ttl,
             "timeout": service.TIMEOUT,
             "max_tokens": service.MAX_TOKENS,
@@ -145,84 +191,56 @@ def performance():
         }), 500
 
 @bp.route('/generate-reason', methods=['POST'])
-def generate_reason():
+@_validated(SingleReasonRequest)
+def generate_reason(req):
     """
     Generate a single reason-based follow-up question for a survey response.
 
     Returns:
         JSON: Generated reason-based follow-up question or error.
     """
-    try:
-        data = request.get_json()
-        req = SingleReasonRequest(**data)
-    except ValidationError as ve:
-        return jsonify(ValidationErrorResponse(
-            detail="Invalid request data.",
-            code="validation_error",
-            errors=ve.errors()
-        ).dict()), 422
-    except Exception as exc:
-        return jsonify(ErrorResponse(
-            detail=f"Malformed request: {exc}",
-            code="bad_request"
-        ).dict()), 400
-
-    service = OpenAIService()
+    service = get_openai_service()
     # Force question type to be REASON only
     prompt = service.build_prompt(req.question, req.response, ["REASON"])
     try:
-        api_response = service.generate_questions(prompt)
-        followups = service.parse_response(api_response)
-        
+        # The caching wrapper keys on (prompt, allowed_types), so repeat
+        # requests skip the API call like /generate-followup does
+        followups = service.generate_followups(prompt, ["REASON"])
+
         # Take only the first question (should be REASON type)
         if followups and len(followups) > 0:
             first_question = followups[0]["text"]
-            response = SingleReasonResponse(
-                question=first_question,
-                original_question=req.question,
-                original_response=req.response
-            )
-            return jsonify(response.dict()), 200
+            return _ojson({
+                "question": first_question,
+                "original_question": req.question,
+                "original_response": req.response
+            }, 200)
         else:
-            return jsonify(ErrorResponse(
-                detail="No follow-up question generated",
-                code="no_question_generated"
-            ).dict()), 500
+            return _ojson({
+                "detail": "No follow-up question generated",
+                "code": "no_question_generated"
+            }, 500)
     except OpenAIAPIError as dse:
-        return jsonify(ErrorResponse(
-            detail=str(dse),
-            code="openai_error"
-        ).dict()), 502
+        return _ojson({
+            "detail": str(dse),
+            "code": "openai_error"
+        }, 502)
     except Exception as exc:
-        return jsonify(ErrorResponse(
-            detail=f"Internal server error: {exc}",
-            code="internal_error"
-        ).dict()), 500
+        return _ojson({
+            "detail": f"Internal server error: {exc}",
+            "code": "internal_error"
+        }, 500)
 
 @bp.route('/generate-multilingual', methods=['POST'])
-def generate_multilingual():
+@_validated(MultilingualQuestionRequest)
+def generate_multilingual(req):
     """
     Generate a single multilingual follow-up question for a survey response.
 
     Returns:
         JSON: Generated multilingual follow-up question or error.
     """
-    try:
-        data = request.get_json()
-        req = MultilingualQuestionRequest(**data)
-    except ValidationError as ve:
-        return jsonify(ValidationErrorResponse(
-            detail="Invalid request data.",
-            code="validation_error",
-            errors=ve.errors()
-        ).dict()), 422
-    except Exception as exc:
-        return jsonify(ErrorResponse(
-            detail=f"Malformed request: {exc}",
-            code="bad_request"
-        ).dict()), 400
-
-    service = OpenAIService()
+    service = get_openai_service()
     try:
         # Generate multilingual question using the new optimized method
         question_text = service.generate_multilingual_question(
@@ -232,49 +250,34 @@ def generate_multilingual():
             req.language
         )
         
-        response = MultilingualQuestionResponse(
-            question=question_text,
-            original_question=req.question,
-            original_response=req.response,
-            type=req.type,
-            language=req.language
-        )
-        return jsonify(response.dict()), 200
+        return _ojson({
+            "question": question_text,
+            "original_question": req.question,
+            "original_response": req.response,
+            "type": req.type,
+            "language": req.language
+        }, 200)
     except OpenAIAPIError as dse:
-        return jsonify(ErrorResponse(
-            detail=str(dse),
-            code="openai_error"
-        ).dict()), 502
+        return _ojson({
+            "detail": str(dse),
+            "code": "openai_error"
+        }, 502)
     except Exception as exc:
-        return jsonify(ErrorResponse(
-            detail=f"Internal server error: {exc}",
-            code="internal_error"
-        ).dict()), 500 
+        return _ojson({
+            "detail": f"Internal server error: {exc}",
+            "code": "internal_error"
+        }, 500) 
 
 @bp.route('/generate-enhanced-multilingual', methods=['POST'])
-def generate_enhanced_multilingual():
+@_validated(EnhancedMultilingualRequest)
+def generate_enhanced_multilingual(req):
     """
     Generate an enhanced multilingual follow-up question with informativeness detection.
 
     Returns:
         JSON: Generated multilingual follow-up question with informativeness flag or error.
     """
-    try:
-        data = request.get_json()
-        req = EnhancedMultilingualRequest(**data)
-    except ValidationError as ve:
-        return jsonify(ValidationErrorResponse(
-            detail="Invalid request data.",
-            code="validation_error",
-            errors=ve.errors()
-        ).dict()), 422
-    except Exception as exc:
-        return jsonify(ErrorResponse(
-            detail=f"Malformed request: {exc}",
-            code="bad_request"
-        ).dict()), 400
-
-    service = OpenAIService()
+    service = get_openai_service()
     try:
         # Generate enhanced multilingual question with informativeness detection
         result = service.generate_enhanced_multilingual_question(
@@ -284,50 +287,74 @@ def generate_enhanced_multilingual():
             req.language
         )
         
-        response = EnhancedMultilingualResponse(
-            informative=result["informative"],
-            question=result.get("question"),
-            original_question=req.question,
-            original_response=req.response,
-            type=req.type,
-            language=req.language
+        return _ojson({
+            "informative": result["informative"],
+            "question": result.get("question"),
+            "original_question": req.question,
+            "original_response": req.response,
+            "type": req.type,
+            "language": req.language
+        }, 200)
+    except OpenAIAPIError as dse:
+        return _ojson({
+            "detail": str(dse),
+            "code": "openai_error"
+        }, 502)
+    except Exception as exc:
+        return _ojson({
+            "detail": f"Internal server error: {exc}",
+            "code": "internal_error"
+        }, 500) 
+
+@bp.route('/score-batch', methods=['POST'])
+@_validated(ScoreBatchRequest)
+def score_batch(req):
+    """
+    Score multiple responses to one question in a single batched call.
+
+    Returns:
+        JSON: Per-response informativeness (and theme, when themes are given) or error.
+    """
+    service = get_openai_service()
+    try:
+        informative_flags = service.detect_informativeness_batch(
+            req.question, req.responses, req.language
         )
-        return jsonify(response.dict()), 200
+        if req.theme_parameters:
+            themes = [t.model_dump() for t in req.theme_parameters.themes]
+            detected_themes = service.detect_themes_in_response_batch(req.responses, themes)
+        else:
+            detected_themes = [None] * len(req.responses)
+
+        return _ojson({"results": [
+            {
+                "informative": 1 if informative else 0,
+                "detected_theme": detected.theme_name if detected else None,
+                "theme_importance": detected.importance if detected else None
+            }
+            for informative, detected in zip(informative_flags, detected_themes)
+        ]}, 200)
     except OpenAIAPIError as dse:
-        return jsonify(ErrorResponse(
-            detail=str(dse),
-            code="openai_error"
-        ).dict()), 502
+        return _ojson({
+            "detail": str(dse),
+            "code": "openai_error"
+        }, 502)
     except Exception as exc:
-        return jsonify(ErrorResponse(
-            detail=f"Internal server error: {exc}",
-            code="internal_error"
-        ).dict()), 500 
+        return _ojson({
+            "detail": f"Internal server error: {exc}",
+            "code": "internal_error"
+        }, 500)
 
 @bp.route('/generate-theme-enhanced', methods=['POST'])
-def generate_theme_enhanced():
+@_validated(ThemeEnhancedRequest)
+def generate_theme_enhanced(req):
     """
     Generate a theme-enhanced multilingual follow-up question with theme analysis.
 
     Returns:
         JSON: Generated theme-enhanced multilingual follow-up question or error.
     """
-    try:
-        data = request.get_json()
-        req = ThemeEnhancedRequest(**data)
-    except ValidationError as ve:
-        return jsonify(ValidationErrorResponse(
-            detail="Invalid request data.",
-            code="validation_error",
-            errors=ve.errors()
-        ).dict()), 422
-    except Exception as exc:
-        return jsonify(ErrorResponse(
-            detail=f"Malformed request: {exc}",
-            code="bad_request"
-        ).dict()), 400
-
-    service = OpenAIService()
+    service = get_openai_service()
     try:
         # Generate theme-enhanced multilingual question
         result = service.generate_theme_enhanced_question(
@@ -336,58 +363,98 @@ def generate_theme_enhanced():
             req.type, 
             req.language,
             req.theme,
-            req.theme_parameters.dict() if req.theme_parameters else None
+            req.theme_parameters.model_dump() if req.theme_parameters else None
         )
         
-        response = ThemeEnhancedResponse(
-            informative=result["informative"],
-            question=result.get("question"),
-            explanation=result.get("explanation"),
-            original_question=req.question,
-            original_response=req.response,
-            type=req.type,
-            language=req.language,
-            theme=req.theme,
-            detected_theme=result.get("detected_theme"),
-            theme_importance=result.get("theme_importance"),
-            highest_importance_theme=result.get("highest_importance_theme")
-        )
-        return jsonify(response.dict()), 200
+        return _ojson({
+            "informative": result["informative"],
+            "question": result.get("question"),
+            "explanation": result.get("explanation"),
+            "original_question": req.question,
+            "original_response": req.response,
+            "type": req.type,
+            "language": req.language,
+            "theme": req.theme,
+            "detected_theme": result.get("detected_theme"),
+            "theme_importance": result.get("theme_importance"),
+            "highest_importance_theme": result.get("highest_importance_theme")
+        }, 200)
     except OpenAIAPIError as dse:
-        return jsonify(ErrorResponse(
-            detail=str(dse),
-            code="openai_error"
-        ).dict()), 502
+        return _ojson({
+            "detail": str(dse),
+            "code": "openai_error"
+        }, 502)
     except Exception as exc:
-        return jsonify(ErrorResponse(
-            detail=f"Internal server error: {exc}",
-            code="internal_error"
-        ).dict()), 500 
+        return _ojson({
+            "detail": f"Internal server error: {exc}",
+            "code": "internal_error"
+        }, 500) 
 
-@bp.route('/generate-theme-enhanced-optional', methods=['POST'])
-def generate_theme_enhanced_optional():
+@bp.route('/generate-theme-enhanced/batch', methods=['POST'])
+@_validated(ThemeEnhancedBatchRequest)
+def generate_theme_enhanced_batch(req):
     """
-    Generate a theme-enhanced multilingual follow-up question with optional informative detection.
+    Generate theme-enhanced questions for a batch of requests concurrently.
 
     Returns:
-        JSON: Generated theme-enhanced multilingual follow-up question or error.
+        JSON: Per-item results in input order; failed items carry an error entry.
     """
+    service = get_openai_service()
     try:
-        data = request.get_json()
-        req = ThemeEnhancedOptionalRequest(**data)
-    except ValidationError as ve:
-        return jsonify(ValidationErrorResponse(
-            detail="Invalid request data.",
-            code="validation_error",
-            errors=ve.errors()
-        ).dict()), 422
+        items = [
+            {
+                "question": item.question,
+                "response": item.response,
+                "question_type": item.type,
+                "language": item.language,
+                "theme": item.theme,
+                "theme_parameters": item.theme_parameters.model_dump() if item.theme_parameters else None
+            }
+            for item in req.items
+        ]
+        results = service.generate_theme_enhanced_batch(items)
+
+        payload = {"results": [
+            {
+                "error": outcome,
+                "code": "openai_error"
+            } if status == "error" else {
+                "informative": outcome["informative"],
+                "question": outcome.get("question"),
+                "explanation": outcome.get("explanation"),
+                "original_question": item.question,
+                "original_response": item.response,
+                "type": item.type,
+                "language": item.language,
+                "theme": item.theme,
+                "detected_theme": outcome.get("detected_theme"),
+                "theme_importance": outcome.get("theme_importance"),
+                "highest_importance_theme": outcome.get("highest_importance_theme")
+            }
+            for item, (status, outcome) in zip(req.items, results)
+        ]}
+        return _ojson(payload, 200)
+    except OpenAIAPIError as dse:
+        return _ojson({
+            "detail": str(dse),
+            "code": "openai_error"
+        }, 502)
     except Exception as exc:
-        return jsonify(ErrorResponse(
-            detail=f"Malformed request: {exc}",
-            code="bad_request"
-        ).dict()), 400
+        return _ojson({
+            "detail": f"Internal server error: {exc}",
+            "code": "internal_error"
+        }, 500)
+
+@bp.route('/generate-theme-enhanced-optional', methods=['POST'])
+@_validated(ThemeEnhancedOptionalRequest)
+def generate_theme_enhanced_optional(req):
+    """
+    Generate a theme-enhanced multilingual follow-up question with optional informative detection.
 
-    service = OpenAIService()
+    Returns:
+        JSON: Generated theme-enhanced multilingual follow-up question or error.
+    """
+    service = get_openai_service()
     try:
         # Generate theme-enhanced multilingual question with optional informative detection
         result = service.generate_theme_enhanced_optional_question(
@@ -397,31 +464,30 @@ def generate_theme_enhanced_optional():
             req.language,
             req.theme,
             req.check_informative,
-            req.theme_parameters.dict() if req.theme_parameters else None
+            req.theme_parameters.model_dump() if req.theme_parameters else None
         )
         
-        response = ThemeEnhancedOptionalResponse(
-            informative=result["informative"],
-            question=result.get("question"),
-            explanation=result.get("explanation"),
-            original_question=req.question,
-            original_response=req.response,
-            type=req.type,
-            language=req.language,
-            theme=req.theme,
-            check_informative=req.check_informative,
-            detected_theme=result.get("detected_theme"),
-            theme_importance=result.get("theme_importance"),
-            highest_importance_theme=result.get("highest_importance_theme")
-        )
-        return jsonify(response.dict()), 200
+        return _ojson({
+            "informative": result["informative"],
+            "question": result.get("question"),
+            "explanation": result.get("explanation"),
+            "original_question": req.question,
+            "original_response": req.response,
+            "type": req.type,
+            "language": req.language,
+            "theme": req.theme,
+            "check_informative": req.check_informative,
+            "detected_theme": result.get("detected_theme"),
+            "theme_importance": result.get("theme_importance"),
+            "highest_importance_theme": result.get("highest_importance_theme")
+        }, 200)
     except OpenAIAPIError as dse:
-        return jsonify(ErrorResponse(
-            detail=str(dse),
-            code="openai_error"
-        ).dict()), 502
+        return _ojson({
+            "detail": str(dse),
+            "code": "openai_error"
+        }, 502)
     except Exception as exc:
-        return jsonify(ErrorResponse(
-            detail=f"Internal server error: {exc}",
-            code="internal_error"
-        ).dict()), 500 
\ No newline at end of file
+        return _ojson({
+            "detail": f"Internal server error: {exc}",
+            "code": "internal_error"
+        }, 500) 
\ No newline at end of file
@@ -8,6 +8,9 @@ def client():
     app = create_app()
     app.config['TESTING'] = True
     app.config['OPENAI_API_KEY'] = 'test-key'
+    # The shared service caches across requests; start each test cold
+    from app.deepseek_service import get_openai_service
+    get_openai_service().cache.clear()
     with app.test_client() as client:
         yield client
 
@@ -48,7 +51,7 @@ def test_generate_followup_success(client, monkeypatch):
     # Patch OpenAIService methods
     from app.deepseek_service import OpenAIService
     monkeypatch.setattr(OpenAIService, 'generate_questions', lambda self, prompt: {"choices": [{"message": {"content": '{"followups": [{"type": "reason", "text": "Why?"}]}'}}]})
-    monkeypatch.setattr(OpenAIService, 'parse_response', lambda self, resp: [{"type": "reason", "text": "Why?"}])
+    monkeypatch.setattr(OpenAIService, 'parse_response', lambda self, resp, allowed_types=None: [{"type": "reason", "text": "Why?"}])
     payload = {
         "question": "What did you like?",
         "response": "The service was fast.",
@@ -82,7 +85,7 @@ def test_generate_reason_success(client, monkeypatch):
     # Patch OpenAIService methods
     from app.deepseek_service import OpenAIService
     monkeypatch.setattr(OpenAIService, 'generate_questions', lambda self, prompt: {"choices": [{"message": {"content": '{"followups": [{"type": "reason", "text": "Why did you find the service fast?"}]}'}}]})
-    monkeypatch.setattr(OpenAIService, 'parse_response', lambda self, resp: [{"type": "reason", "text": "Why did you find the service fast?"}])
+    monkeypatch.setattr(OpenAIService, 'parse_response', lambda self, resp, allowed_types=None: [{"type": "reason", "text": "Why did you find the service fast?"}])
     
     payload = {
         "question": "What did you like?",
@@ -103,7 +106,7 @@ def test_generate_reason_no_question_generated(client, monkeypatch):
     # Patch OpenAIService methods to return empty response
     from app.deepseek_service import OpenAIService
     monkeypatch.setattr(OpenAIService, 'generate_questions', lambda self, prompt: {"choices": [{"message": {"content": '{"followups": []}'}}]})
-    monkeypatch.setattr(OpenAIService, 'parse_response', lambda self, resp: [])
+    monkeypatch.setattr(OpenAIService, 'parse_response', lambda self, resp, allowed_types=None: [])
     
     payload = {
         "question": "What did you like?",
@@ -112,4 +115,72 @@ def test_generate_reason_no_question_generated(client, monkeypatch):
     resp = client.post('/generate-reason', data=json.dumps(payload), content_type='application/json')
     assert resp.status_code == 500
     data = resp.get_json()
-    assert data['code'] == 'no_question_generated' 
\ No newline at end of file
+    assert data['code'] == 'no_question_generated'
+
+def test_score_batch_validation_error(client):
+    """Test /score-batch returns 422 for invalid input."""
+    resp = client.post('/score-batch', json={})
+    assert resp.status_code == 422
+    data = resp.get_json()
+    assert data['code'] == 'validation_error'
+
+def test_score_batch_success(client, monkeypatch):
+    """Test /score-batch returns per-response results on valid input."""
+    # Patch OpenAIService batch methods
+    from app.deepseek_service import OpenAIService, ThemeResult
+    monkeypatch.setattr(OpenAIService, 'detect_informativeness_batch',
+                        lambda self, question, responses, language="English": [True, False])
+    monkeypatch.setattr(OpenAIService, 'detect_themes_in_response_batch',
+                        lambda self, responses, themes: [ThemeResult(theme_name="speed", importance=80), None])
+
+    payload = {
+        "question": "What did you like?",
+        "responses": ["The service was fast.", "idk"],
+        "theme_parameters": {"themes": [{"name": "speed", "importance": 80}]}
+    }
+    resp = client.post('/score-batch', data=json.dumps(payload), content_type='application/json')
+    assert resp.status_code == 200
+    results = resp.get_json()['results']
+    assert len(results) == 2
+    assert results[0] == {"informative": 1, "detected_theme": "speed", "theme_importance": 80}
+    assert results[1] == {"informative": 0, "detected_theme": None, "theme_importance": None}
+
+def test_generate_theme_enhanced_batch_validation_error(client):
+    """Test /generate-theme-enhanced/batch returns 422 for an empty batch."""
+    resp = client.post('/generate-theme-enhanced/batch', json={"items": []})
+    assert resp.status_code == 422
+    data = resp.get_json()
+    assert data['code'] == 'validation_error'
+
+def test_generate_theme_enhanced_batch_success(client, monkeypatch):
+    """Test /generate-theme-enhanced/batch returns per-item results, including error entries."""
+    # Patch OpenAIService batch method: first item succeeds, second fails
+    from app.deepseek_service import OpenAIService
+    monkeypatch.setattr(OpenAIService, 'generate_theme_enhanced_batch',
+                        lambda self, items: [
+                            ("ok", {"informative": 1, "question": "Why was it fast?",
+                                    "explanation": "Focuses on the speed theme.",
+                                    "detected_theme": "speed", "theme_importance": 80,
+                                    "highest_importance_theme": None}),
+                            ("error", "API error: 500"),
+                        ])
+
+    item = {
+        "question": "What did you like?",
+        "response": "The service was fast.",
+        "type": "reason",
+        "language": "English",
+        "theme": "Yes",
+        "theme_parameters": {"themes": [{"name": "speed", "importance": 80}]}
+    }
+    payload = {"items": [item, dict(item, response="idk")]}
+    resp = client.post('/generate-theme-enhanced/batch', data=json.dumps(payload), content_type='application/json')
+    assert resp.status_code == 200
+    results = resp.get_json()['results']
+    assert len(results) == 2
+    assert results[0]['informative'] == 1
+    assert results[0]['question'] == "Why was it fast?"
+    assert results[0]['detected_theme'] == "speed"
+    assert results[0]['original_response'] == "The service was fast."
+    assert results[1] == {"error": "API error: 500", "code": "openai_error"}
+